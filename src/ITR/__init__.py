@@ -3,17 +3,28 @@ This package helps companies and financial institutions to assess the temperatur
 portfolios.
 """
 
+import importlib
 import os
 
 import numpy as np
 import pandas as pd
 import pint
 
-from . import utils  # noqa F401
-from .interfaces import EScope
-
 data_dir = os.path.join(__path__[0], "data", "json")
 
+# Submodules are imported on first use (PEP 562) so that `import ITR` does not pay for the unit registry
+_LAZY_SUBMODULES = frozenset(["configs", "data", "interfaces", "portfolio_aggregation", "temperature_score", "utils"])
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name == "umean" and HAS_UNCERTAINTIES:
+        from .utils import umean
+
+        return umean
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def _AffineScalarFunc__hash__(self):
     if not self._linear_part.expanded():
@@ -53,7 +64,6 @@ try:
 
     _ufloat_nan = ufloat(np.nan, 0.0)
     pint.pint_eval.tokenizer = pint.pint_eval.uncertainty_tokenizer
-    from .utils import umean  # noqa F401
 
     uncertainties.AffineScalarFunc.__hash__ = _AffineScalarFunc__hash__
     uncertainties.Variable.__hash__ = _Variable__hash__
@@ -98,15 +108,22 @@ def Q_m_as(value, units, inplace=False):
     If the Quanity is not already in UNITS, then convert in place.
     Returns the MAGNITUDE of the (possibly) converted value.
     """
+    from .data.osc_units import conversion_factor, parse_units
+
     x = value
     if isinstance(value, str):
         x = pint.Quantity(value)
+    units = parse_units(units)
     if x.u == units:
         return x.m
     if inplace:
         x.ito(units)
         return x.m
-    return x.to(units).m
+    try:
+        return x.m * conversion_factor(x.u, units)
+    except ValueError:
+        # Offset units (such as degC) must be converted by Pint
+        return x.to(units).m
 
 
 def recombine_nom_and_std(nom: pd.Series, std: pd.Series) -> pd.Series:
@@ -127,6 +144,8 @@ def recombine_nom_and_std(nom: pd.Series, std: pd.Series) -> pd.Series:
 
 
 def JSONEncoder(q):
+    from .interfaces import EScope
+
     if isinstance(q, pint.Quantity):
         if isna(q.m):
             return f"nan {q.u}"
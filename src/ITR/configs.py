@@ -208,6 +208,8 @@ class ProjectionControls:
     BASE_YEAR: int = 2019
     TARGET_YEAR: int = 2050
     TREND_CALC_METHOD: Callable[[pd.DataFrame, Optional[str], Optional[bool]], pd.DataFrame] = ITR_median
+    # Project trajectories for at most this many companies at a time (None: all companies at once)
+    PROJECTION_CHUNK_SIZE: Optional[int] = None
 
 
 class TemperatureScoreControls(BaseModel):
@@ -1,16 +1,20 @@
+import hashlib
+import json
 import logging
 import warnings  # needed until quantile behaves better with Pint quantities in arrays
 from functools import partial, reduce
-from typing import Any, Callable, Dict, List, Optional, Type, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, cast
 
 import numpy as np
 import pandas as pd
 from pint import DimensionalityError
+from pint_pandas.pint_array import NO_UNIT
 
 import ITR
 
 from ..configs import ColumnsConfig, LoggingConfig, ProjectionControls, VariablesConfig
 from ..data import PA_, Q_, PintType, ureg
+from ..data.benchmark_bundle import read_bundle, write_bundle
 from ..data.data_providers import (
     CompanyDataProvider,
     IntensityBenchmarkDataProvider,
@@ -19,8 +23,6 @@ from ..data.data_providers import (
 from ..data.osc_units import (
     Quantity,
     align_production_to_bm,
-    asPintDataFrame,
-    asPintSeries,
 )
 from ..interfaces import (
     DF_ICompanyEIProjections,
@@ -102,6 +104,7 @@ class BaseProviderProductionBenchmark(ProductionBenchmarkDataProvider):
         """
         super().__init__()
         self.column_config = column_config
+        self._json_path: Optional[str] = None
         self._productions_benchmarks = production_benchmarks
         self._own_data = True
         try:
@@ -116,21 +119,101 @@ class BaseProviderProductionBenchmark(ProductionBenchmarkDataProvider):
                 )
         except AttributeError:
             assert False
+        self._init_prod_df(_prod_delta_df_t)
+
+    @classmethod
+    def from_json(
+        cls,
+        json_path: str,
+        column_config: Type[ColumnsConfig] = ColumnsConfig,
+        bundle_dir: Optional[str] = None,
+    ) -> "BaseProviderProductionBenchmark":
+        """
+        Load a production benchmark from its compiled bundle if that is up to date with JSON_PATH.
+        Otherwise load it from JSON_PATH and (re)compile the bundle.
+        :param json_path: path to the IProductionBenchmarkScopes JSON file (the source of truth)
+        :param column_config: An optional ColumnsConfig object containing relevant variable names
+        :param bundle_dir: directory holding compiled bundles (see ITR.data.benchmark_bundle)
+        :return: the production benchmark provider
+        """
+        bundle = read_bundle(json_path, bundle_dir)
+        if bundle is None:
+            with open(json_path) as json_file:
+                production_bm = cls(IProductionBenchmarkScopes.model_validate(json.load(json_file)), column_config)
+            production_bm._json_path = json_path
+            write_bundle(json_path, *production_bm._to_bundle(), bundle_dir=bundle_dir)
+            return production_bm
+
+        arrays, metadata = bundle
+        production_bm = cls.__new__(cls)
+        ProductionBenchmarkDataProvider.__init__(production_bm)
+        production_bm.column_config = column_config
+        production_bm._json_path = json_path
+        production_bm._productions_benchmarks_model = None
+        production_bm._own_data = True
+        production_bm._init_prod_df(
+            pd.DataFrame(
+                arrays["deltas"].T,
+                index=arrays["years"],
+                columns=pd.MultiIndex.from_tuples(
+                    [(sector, region, EScope[scope_name]) for sector, region, scope_name in metadata["columns"]]
+                ),
+            )
+        )
+        return production_bm
+
+    def _init_prod_df(self, prod_delta_df_t: pd.DataFrame):
+        """
+        Set up the projected production DataFrame (and fingerprint) from the year-over-year production changes.
+        :param prod_delta_df_t: production changes, one row per year and one column per sector, region, and scope
+        """
+        self._prod_delta_df_t = prod_delta_df_t
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             # Quieting warnings due to https://github.com/hgrecco/pint/issues/1897
             # See comment above to understand use of `cumprod` function
-            self._prod_df = _prod_delta_df_t.add(1.0).cumprod(axis=0).astype("pint[dimensionless]").T
+            prod_df_t = prod_delta_df_t.add(1.0).cumprod(axis=0)
+            self._prod_df = prod_df_t.astype("pint[dimensionless]").T
+        self._fingerprint = benchmark_fingerprint(prod_delta_df_t)
         self._prod_df.columns.name = "year"
         self._prod_df.index.names = [
             self.column_config.SECTOR,
             self.column_config.REGION,
             self.column_config.SCOPE,
         ]
+        # Positions of company benchmarks within self._prod_df, by (sector, region), and the benchmark magnitudes
+        # they index (with a trailing row of NaNs for position -1, companies without a benchmark)
+        self._company_bm_positions: Dict[Tuple[str, str], int] = {}
+        self._company_bm_m = np.vstack([prod_df_t.to_numpy(dtype=np.float64).T, np.full(len(prod_df_t), np.nan)])
+
+    def _to_bundle(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """
+        :return: the arrays and metadata from which `from_json` can rebuild this benchmark
+        """
+        arrays = {
+            "years": self._prod_delta_df_t.index.to_numpy(dtype=np.int64),
+            "deltas": np.ascontiguousarray(self._prod_delta_df_t.to_numpy(dtype=np.float64).T),
+        }
+        metadata = {
+            "columns": [[sector, region, scope.name] for sector, region, scope in self._prod_delta_df_t.columns],
+        }
+        return arrays, metadata
+
+    @property
+    def _productions_benchmarks(self) -> IProductionBenchmarkScopes:
+        # Benchmarks loaded from a compiled bundle only parse their JSON source if the pydantic model is needed
+        if self._productions_benchmarks_model is None:
+            assert self._json_path is not None
+            with open(self._json_path) as json_file:
+                self._productions_benchmarks_model = IProductionBenchmarkScopes.model_validate(json.load(json_file))
+        return self._productions_benchmarks_model
+
+    @_productions_benchmarks.setter
+    def _productions_benchmarks(self, production_benchmarks: IProductionBenchmarkScopes):
+        self._productions_benchmarks_model = production_benchmarks
 
     def benchmark_changed(self, new_projected_production: ProductionBenchmarkDataProvider) -> bool:
-        assert isinstance(new_projected_production, BaseProviderProductionBenchmark)
-        return self._productions_benchmarks != new_projected_production._productions_benchmarks
+        return self.fingerprint != new_projected_production.fingerprint
 
     # Note that benchmark production series are dimensionless.
     # FIXME: They also don't need a scope.  Remove scope when we change IBenchmark format...
@@ -176,6 +259,33 @@ class BaseProviderProductionBenchmark(ProductionBenchmarkDataProvider):
 
         return df_partial_pp
 
+    def _get_company_benchmark_positions(self, company_sector_region_scope: pd.DataFrame) -> np.ndarray:
+        """
+        Look up the row of self._prod_df benchmarking each company, caching positions by sector and region
+        so that each sector/region (and its possible fallback to 'Global') is only resolved once per benchmark.
+        :param company_sector_region_scope: DataFrame with at least the columns ColumnsConfig.SECTOR and ColumnsConfig.REGION
+        :return: an array of row positions, -1 where neither the region nor 'Global' is benchmarked
+        """
+        sector_regions = list(
+            zip(
+                company_sector_region_scope[self.column_config.SECTOR],
+                company_sector_region_scope[self.column_config.REGION],
+            )
+        )
+        new_sector_regions = [
+            sector_region
+            for sector_region in dict.fromkeys(sector_regions)
+            if sector_region not in self._company_bm_positions
+        ]
+        if new_sector_regions:
+            # Production benchmarks are only given for AnyScope
+            positions = get_benchmark_column_positions(
+                self._prod_df.index,
+                pd.DataFrame(new_sector_regions, columns=["sector", "region"]).assign(scope=EScope.AnyScope),
+            )
+            self._company_bm_positions.update(zip(new_sector_regions, positions.tolist()))
+        return np.array([self._company_bm_positions[sector_region] for sector_region in sector_regions], dtype=np.int64)
+
     def get_company_projected_production(self, company_sector_region_scope: pd.DataFrame) -> pd.DataFrame:
         """
         get the projected productions for list of companies
@@ -183,24 +293,97 @@ class BaseProviderProductionBenchmark(ProductionBenchmarkDataProvider):
         ColumnsConfig.COMPANY_ID, ColumnsConfig.SECTOR, ColumnsConfig.REGION, ColumnsConfig.SCOPE
         :return: DataFrame of projected productions for [base_year through 2050]
         """
-        from ..utils import get_benchmark_projections
+        df = (
+            company_sector_region_scope[
+                [
+                    self.column_config.SECTOR,
+                    self.column_config.REGION,
+                    self.column_config.SCOPE,
+                    self.column_config.BASE_YEAR_PRODUCTION,
+                ]
+            ]
+            .reset_index()
+            .drop_duplicates(
+                subset=[
+                    self.column_config.COMPANY_ID,
+                    self.column_config.SECTOR,
+                    self.column_config.REGION,
+                    self.column_config.SCOPE,
+                ]
+            )
+        )
+        positions = self._get_company_benchmark_positions(df)
+        company_production = df[self.column_config.BASE_YEAR_PRODUCTION]
+        if isinstance(company_production.dtype, PintType):
+            production_units = [company_production.dtype.units] * len(df)
+            production_m = company_production.values.quantity.m
+        else:
+            # Base year productions are heterogeneous: carry the units of each company separately from the magnitudes
+            production_units = [x.u if isinstance(x, Quantity) else ureg.dimensionless for x in company_production]
+            production_m = np.array([x.m if isinstance(x, Quantity) else x for x in company_production])
+        nan_production = pd.isna(ITR.nominal_values(production_m))
+        if nan_production.any():
+            # If we don't have valid production data for base year, we get back a nan result that's a pain to debug, so nag here
+            logger.error(
+                f"these companies are missing production data: {df.loc[nan_production, self.column_config.COMPANY_ID].to_list()}"
+            )
+        projected_m = self._company_bm_m[positions] * production_m[:, np.newaxis]
+        # Each company's row of Quantities carries that company's production units.  Companies are rows and years
+        # are columns, so a column mixes the units of every company and cannot be a PintArray.  Callers transpose
+        # this frame (e.g. DataWarehouse._get_cumulative_emissions), and pandas would expand PintArrays built per
+        # unit group back into these same Quantity cells.
+        projected_cells = np.empty(projected_m.shape, dtype=object)
+        for i, production_unit in enumerate(production_units):
+            projected_cells[i] = np.fromiter(
+                Q_(projected_m[i], production_unit), dtype=object, count=projected_m.shape[1]
+            )
+        company_projected_productions = pd.DataFrame(
+            projected_cells,
+            index=pd.MultiIndex.from_frame(df[[self.column_config.COMPANY_ID, self.column_config.SCOPE]]),
+            columns=self._prod_df.columns,
+        )
+        company_projected_productions.columns.name = None
+        return company_projected_productions
 
-        company_benchmark_projections = get_benchmark_projections(self._prod_df, company_sector_region_scope)
-        company_production = company_sector_region_scope.set_index(self.column_config.SCOPE, append=True)[
-            self.column_config.BASE_YEAR_PRODUCTION
-        ]
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            # We have to use lambda function here because company_production is heterogeneous, not a PintArray
-            nan_production = company_production.map(lambda x: ITR.isna(x))
-            if nan_production.any():
-                # If we don't have valid production data for base year, we get back a nan result that's a pain to debug, so nag here
-                logger.error(
-                    f"these companies are missing production data: {nan_production[nan_production].index.get_level_values(0).to_list()}"
-                )
-            # We transpose the operation so that Pandas is happy to preserve the dtype integrity of the column
-            company_projected_productions_t = company_benchmark_projections.T.mul(company_production, axis=1)
-            return company_projected_productions_t.T
+
+def benchmark_fingerprint(df: pd.DataFrame, *flags: Any) -> str:
+    """
+    Compute a stable digest of benchmark content so that benchmarks can be compared (and cached) without walking
+    every projection Quantity.
+
+    :param df: benchmark DataFrame, one column per benchmark series
+    :param flags: any further benchmark parameters (temperature, budget, etc.) that distinguish benchmarks
+    :return: a hex digest of the labels, units, and magnitudes of DF, together with FLAGS
+    """
+    digest = hashlib.sha256(repr((df.index.to_list(), df.columns.to_list(), flags)).encode())
+    for _, col in df.items():
+        if isinstance(col.dtype, PintType):
+            digest.update(str(col.dtype.units).encode())
+            col_m = col.values.quantity.m
+        else:
+            col_m = col.to_numpy()
+        digest.update(np.ascontiguousarray(ITR.nominal_values(col_m), dtype=np.float64).tobytes())
+        if col_m.dtype == object:
+            digest.update(np.ascontiguousarray(ITR.std_devs(col_m), dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def get_benchmark_column_positions(bm_columns: pd.MultiIndex, sec_reg_scopes: pd.DataFrame) -> np.ndarray:
+    """
+    Map each row of SEC_REG_SCOPES to the position of its benchmark column, falling back to the 'Global' region
+    for sector/scope combinations that arrive with unknown region values.
+
+    :param bm_columns: benchmark columns, indexed by sector, region, and scope
+    :param sec_reg_scopes: DataFrame with columns "sector", "region", and "scope"
+    :return: an array of column positions, -1 where neither the region nor 'Global' is benchmarked
+    """
+    positions = bm_columns.get_indexer(pd.MultiIndex.from_frame(sec_reg_scopes[["sector", "region", "scope"]]))
+    missing = positions < 0
+    if missing.any():
+        positions[missing] = bm_columns.get_indexer(
+            pd.MultiIndex.from_frame(sec_reg_scopes.loc[missing, ["sector", "region", "scope"]].assign(region="Global"))
+        )
+    return positions
 
 
 class BaseProviderIntensityBenchmark(IntensityBenchmarkDataProvider):
@@ -216,9 +399,17 @@ class BaseProviderIntensityBenchmark(IntensityBenchmarkDataProvider):
             EI_benchmarks.is_AFOLU_included,
         )
         self._own_data = True
+        self._json_path: Optional[str] = None
         self._EI_benchmarks = EI_benchmarks
         self.column_config = column_config
         self.projection_controls = projection_controls
+        # The production_centric flag of each scope that has benchmarks
+        self._scope_production_centric: Dict[str, bool] = {
+            scope_name: scope_benchmarks.production_centric
+            for scope_name in EScope.get_scopes()
+            if (scope_benchmarks := getattr(EI_benchmarks, scope_name, None)) is not None
+            and (scope_benchmarks.benchmarks or scope_benchmarks.production_centric)
+        }
         benchmarks_as_series = []
         for scope_name in EScope.get_scopes():
             try:
@@ -227,40 +418,126 @@ class BaseProviderIntensityBenchmark(IntensityBenchmarkDataProvider):
             except AttributeError:
                 pass
 
-        self._EI_df_t = pd.concat(benchmarks_as_series, axis=1)
+        self._init_EI_df_t(pd.concat(benchmarks_as_series, axis=1))
+
+    @classmethod
+    def from_json(
+        cls,
+        json_path: str,
+        column_config: Type[ColumnsConfig] = ColumnsConfig,
+        projection_controls: ProjectionControls = ProjectionControls(),
+        bundle_dir: Optional[str] = None,
+    ) -> "BaseProviderIntensityBenchmark":
+        """
+        Load intensity benchmarks from their compiled bundle if that is up to date with JSON_PATH (and PROJECTION_CONTROLS).
+        Otherwise load them from JSON_PATH and (re)compile the bundle.
+        :param json_path: path to the IEIBenchmarkScopes JSON file (the source of truth)
+        :param column_config: An optional ColumnsConfig object containing relevant variable names
+        :param projection_controls: Projection Controls set the BASE_YEAR and TARGET_YEAR of the benchmarks
+        :param bundle_dir: directory holding compiled bundles (see ITR.data.benchmark_bundle)
+        :return: the intensity benchmark provider
+        """
+        projection_years = [projection_controls.BASE_YEAR, projection_controls.TARGET_YEAR]
+        bundle = read_bundle(json_path, bundle_dir, projection_years=projection_years)
+        if bundle is None:
+            with open(json_path) as json_file:
+                EI_bm = cls(IEIBenchmarkScopes.model_validate(json.load(json_file)), column_config, projection_controls)
+            EI_bm._json_path = json_path
+            write_bundle(json_path, *EI_bm._to_bundle(), bundle_dir=bundle_dir)
+            return EI_bm
+
+        arrays, metadata = bundle
+        EI_bm = cls.__new__(cls)
+        IntensityBenchmarkDataProvider.__init__(
+            EI_bm,
+            Q_(*metadata["benchmark_temperature"]),
+            Q_(*metadata["benchmark_global_budget"]),
+            metadata["is_AFOLU_included"],
+        )
+        EI_bm._own_data = True
+        EI_bm._json_path = json_path
+        EI_bm._EI_benchmarks_model = None
+        EI_bm.column_config = column_config
+        EI_bm.projection_controls = projection_controls
+        EI_bm._scope_production_centric = metadata["scope_production_centric"]
+        EI_bm._init_EI_df_t(
+            pd.DataFrame(
+                {
+                    (sector, region, EScope[scope_name]): PA_(magnitudes, dtype=f"pint[{units}]")
+                    for (sector, region, scope_name, units), magnitudes in zip(
+                        metadata["columns"], arrays["magnitudes"]
+                    )
+                },
+                index=arrays["years"],
+            )
+        )
+        return EI_bm
+
+    def _init_EI_df_t(self, EI_df_t: pd.DataFrame):
+        """
+        Set up the benchmark intensity DataFrame (and fingerprint) of this provider.
+        :param EI_df_t: benchmark intensities, one row per year and one column per sector, region, and scope
+        """
+        self._EI_df_t = EI_df_t
         self._EI_df_t.index.name = "year"
         self._EI_df_t.columns.set_names(["sector", "region", "scope"], inplace=True)
         # https://stackoverflow.com/a/56528071/1291237
         self._EI_df_t.sort_index(axis=1, inplace=True)
+        # SDA paths depend only on the benchmark, so all companies sharing a benchmark share its path
+        self._SDA_paths: Optional[pd.DataFrame] = None
+        self._SDA_has_benchmark = np.zeros(0, dtype=bool)
+        self._fingerprint = benchmark_fingerprint(self._EI_df_t, list(self._scope_production_centric.items()))
+
+    def _to_bundle(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """
+        :return: the arrays and metadata from which `from_json` can rebuild these benchmarks
+        """
+        arrays = {
+            "years": self._EI_df_t.index.to_numpy(dtype=np.int64),
+            # One contiguous row of magnitudes per benchmark
+            "magnitudes": np.array([col.values.quantity.m for _, col in self._EI_df_t.items()], dtype=np.float64),
+        }
+        metadata = {
+            "projection_years": [self.projection_controls.BASE_YEAR, self.projection_controls.TARGET_YEAR],
+            "columns": [
+                [sector, region, scope.name, str(col.dtype.units)]
+                for (sector, region, scope), col in self._EI_df_t.items()
+            ],
+            "benchmark_temperature": [self._benchmark_temperature.m, str(self._benchmark_temperature.u)],
+            "benchmark_global_budget": [self._benchmark_global_budget.m, str(self._benchmark_global_budget.u)],
+            "is_AFOLU_included": self._is_AFOLU_included,
+            "scope_production_centric": self._scope_production_centric,
+        }
+        return arrays, metadata
+
+    @property
+    def _EI_benchmarks(self) -> IEIBenchmarkScopes:
+        # Benchmarks loaded from a compiled bundle only parse their JSON source if the pydantic model is needed
+        if self._EI_benchmarks_model is None:
+            assert self._json_path is not None
+            with open(self._json_path) as json_file:
+                self._EI_benchmarks_model = IEIBenchmarkScopes.model_validate(json.load(json_file))
+        return self._EI_benchmarks_model
+
+    @_EI_benchmarks.setter
+    def _EI_benchmarks(self, EI_benchmarks: IEIBenchmarkScopes):
+        self._EI_benchmarks_model = EI_benchmarks
 
     def get_scopes(self) -> List[EScope]:
-        scopes = [
-            scope
-            for scope in EScope.get_result_scopes()
-            if getattr(self._EI_benchmarks, scope.name) != ITR.interfaces.empty_IBenchmarks
-        ]
+        scopes = [scope for scope in EScope.get_result_scopes() if scope.name in self._scope_production_centric]
         return scopes
 
     def benchmarks_changed(self, new_projected_ei: IntensityBenchmarkDataProvider) -> bool:
-        assert isinstance(new_projected_ei, BaseProviderIntensityBenchmark)
-        return self._EI_benchmarks != new_projected_ei._EI_benchmarks
+        return self.fingerprint != new_projected_ei.fingerprint
 
     def prod_centric_changed(self, new_projected_ei: IntensityBenchmarkDataProvider) -> bool:
-        prev_prod_centric = next_prod_centric = False
-        if getattr(self._EI_benchmarks, "S1S2", None):
-            prev_prod_centric = self._EI_benchmarks["S1S2"].production_centric
-        assert isinstance(new_projected_ei, BaseProviderIntensityBenchmark)
-        if getattr(new_projected_ei._EI_benchmarks, "S1S2", None):
-            next_prod_centric = new_projected_ei._EI_benchmarks["S1S2"].production_centric
-        return prev_prod_centric != next_prod_centric
+        return self.is_production_centric() != new_projected_ei.is_production_centric()
 
     def is_production_centric(self) -> bool:
         """
         returns True if benchmark is "production_centric" (as defined by OECM)
         """
-        if getattr(self._EI_benchmarks, "S1S2", None):
-            return self._EI_benchmarks["S1S2"].production_centric
-        return False
+        return self._scope_production_centric.get("S1S2", False)
 
     # SDA stands for Sectoral Decarbonization Approach; see https://sciencebasedtargets.org/resources/files/SBTi-Power-Sector-15C-guide-FINAL.pdf
     def get_SDA_intensity_benchmarks(
@@ -273,23 +550,49 @@ class BaseProviderIntensityBenchmark(IntensityBenchmarkDataProvider):
         ColumnsConfig.COMPANY_ID, ColumnsConfig.BASE_EI, ColumnsConfig.SECTOR, ColumnsConfig.REGION, ColumnsConfig.SCOPE
         :return: A DataFrame with company and SDA intensity benchmarks per calendar year per row
         """
-        # To make pint happier, we do our math in columns that can be represented by PintArrays
-        intensity_benchmarks_t = self._get_intensity_benchmarks(company_info_at_base_year, scope_to_calc)
-        decarbonization_paths_t = self._get_decarbonizations_paths(intensity_benchmarks_t)
-        last_ei = intensity_benchmarks_t.loc[self.projection_controls.TARGET_YEAR]
-        ei_base = intensity_benchmarks_t.loc[self.projection_controls.BASE_YEAR]
-        df_t = decarbonization_paths_t.mul((ei_base - last_ei), axis=1)
-        df_t = df_t.add(last_ei, axis=1)
-        df_t.index.name = "year"
+        sda_paths = self._get_SDA_paths()
+        sec_reg_scopes = company_info_at_base_year[["sector", "region", "scope"]]
+        if scope_to_calc is not None:
+            sec_reg_scopes = sec_reg_scopes[sec_reg_scopes.scope.eq(scope_to_calc)]
+        # Gather each company's path from its (sector, region, scope) benchmark, skipping empty benchmarks
+        positions = get_benchmark_column_positions(sda_paths.index, sec_reg_scopes)
+        found = positions >= 0
+        found[found] = self._SDA_has_benchmark[positions[found]]
+        df = sda_paths.take(positions[found])
+        df.index = pd.MultiIndex.from_arrays(
+            [sec_reg_scopes.index[found], sec_reg_scopes.scope.values[found]], names=["company_id", "scope"]
+        )
         idx = pd.Index.intersection(
-            df_t.columns,
+            df.index,
             pd.MultiIndex.from_arrays([company_info_at_base_year.index, company_info_at_base_year.scope]),
         )
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            # pint units don't like being twisted from columns to rows, but it's ok
-            df = df_t[idx].T
-        return df
+        return df.loc[idx]
+
+    def _get_SDA_paths(self) -> pd.DataFrame:
+        """
+        Returns the SDA intensity benchmark paths for every benchmark, computing them only once.
+        :return: A DataFrame with SDA intensity benchmarks per calendar year per column, one row per sector, region, and scope
+        """
+        if self._SDA_paths is None:
+            # To make pint happier, we do our math in columns that can be represented by PintArrays
+            intensity_benchmarks_t = self._EI_df_t.loc[
+                range(
+                    self.projection_controls.BASE_YEAR,
+                    self.projection_controls.TARGET_YEAR + 1,
+                )
+            ]
+            decarbonization_paths_t = self._get_decarbonizations_paths(intensity_benchmarks_t)
+            last_ei = intensity_benchmarks_t.loc[self.projection_controls.TARGET_YEAR]
+            ei_base = intensity_benchmarks_t.loc[self.projection_controls.BASE_YEAR]
+            df_t = decarbonization_paths_t.mul((ei_base - last_ei), axis=1)
+            df_t = df_t.add(last_ei, axis=1)
+            df_t.index.name = "year"
+            self._SDA_has_benchmark = ~intensity_benchmarks_t.isna().all().to_numpy()
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                # pint units don't like being twisted from columns to rows, but it's ok
+                self._SDA_paths = df_t.T
+        return self._SDA_paths
 
     def _get_decarbonizations_paths(self, intensity_benchmarks_t: pd.DataFrame) -> pd.DataFrame:
         """
@@ -354,47 +657,21 @@ class BaseProviderIntensityBenchmark(IntensityBenchmarkDataProvider):
         sec_reg_scopes = company_sector_region_scope[["sector", "region", "scope"]]
         if scope_to_calc is not None:
             sec_reg_scopes = sec_reg_scopes[sec_reg_scopes.scope.eq(scope_to_calc)]
-        sec_reg_scopes_mi = pd.MultiIndex.from_frame(sec_reg_scopes).unique()
         bm_proj_t = self._EI_df_t.loc[
             range(
                 self.projection_controls.BASE_YEAR,
                 self.projection_controls.TARGET_YEAR + 1,
-            ),
-            # Here we gather all requested combos as well as ensuring we have 'Global' regional coverage
-            # for sector/scope combinations that arrive with unknown region values
-            [
-                col
-                for col in sec_reg_scopes_mi.append(
-                    pd.MultiIndex.from_frame(sec_reg_scopes.assign(region="Global"))
-                ).unique()
-                if col in self._EI_df_t.columns
-            ],
+            )
         ]
-        # This piece of work essentially does a column-based join (to avoid extra transpositions)
-        result = pd.concat(
-            [
-                (
-                    bm_proj_t[tuple(ser)].rename((idx, ser.iloc[2]))
-                    if tuple(ser) in bm_proj_t
-                    else (
-                        bm_proj_t[ser_global].rename((idx, ser.iloc[2]))
-                        if (
-                            ser_global := (
-                                ser.iloc[0],
-                                "Global",
-                                ser.iloc[2],
-                            )
-                        )
-                        in bm_proj_t
-                        else pd.Series()
-                    )
-                )
-                for idx, ser in sec_reg_scopes.iterrows()
-            ],
-            axis=1,
-        ).dropna(axis=1, how="all")
-        result.columns = pd.MultiIndex.from_tuples(result.columns, names=["company_id", "scope"])
-        return result
+        # This piece of work essentially does a column-based join (to avoid extra transpositions):
+        # every company's benchmark column is gathered with a single take
+        positions = get_benchmark_column_positions(bm_proj_t.columns, sec_reg_scopes)
+        found = positions >= 0
+        result = bm_proj_t.take(positions[found], axis=1)
+        result.columns = pd.MultiIndex.from_arrays(
+            [sec_reg_scopes.index[found], sec_reg_scopes.scope.values[found]], names=["company_id", "scope"]
+        )
+        return result.dropna(axis=1, how="all")
 
 
 class BaseCompanyDataProvider(CompanyDataProvider):
@@ -586,25 +863,51 @@ class BaseCompanyDataProvider(CompanyDataProvider):
             )
         # Normalize all intensity metrics to match benchmark intensity metrics (as much as we can)
         logger.info("Normalizing intensity metrics")
+        bm_sector_regions = set(ei_df_t.columns.droplevel(-1))
+        bm_ei_units: Dict[Tuple[str, str], Any] = {}
+        to_normalize = []
         for company in companies:
             sector = company.sector
-            region = company.region
-            if (sector, region) in ei_df_t.columns:
-                ei_dtype = ei_df_t[(sector, region)].dtypes.iloc[0]
-            elif (sector, "Global") in ei_df_t.columns:
-                ei_dtype = ei_df_t[(sector, "Global")].dtypes.iloc[0]
-            else:
+            region = company.region if (sector, company.region) in bm_sector_regions else "Global"
+            if (sector, region) not in bm_sector_regions:
                 continue
+            if (sector, region) not in bm_ei_units:
+                bm_ei_units[(sector, region)] = ei_df_t[(sector, region)].dtypes.iloc[0].units
             for scope in EScope.get_scopes():
                 if company.projected_intensities[scope]:
-                    setattr(
-                        company.projected_intensities,
-                        scope,
-                        DF_ICompanyEIProjections(
-                            ei_metric=str(ei_dtype.units),
-                            projections=company.projected_intensities[scope].projections,
-                        ),
-                    )
+                    to_normalize.append((company, scope, (sector, region)))
+        # One conversion factor per (sector, region, source unit), applied to all projections in one multiply
+        conversion_factors: Dict[Tuple[str, str, Any], float] = {}
+        converted = []
+        for i, (company, scope, sector_region) in enumerate(to_normalize):
+            src_units = company.projected_intensities[scope].projections.dtype.units
+            ei_units = bm_ei_units[sector_region]
+            if src_units == ei_units:
+                continue
+            key = (*sector_region, src_units)
+            if key not in conversion_factors:
+                conversion_factors[key] = Q_(1.0, src_units).to(ei_units).m
+            converted.append((i, conversion_factors[key]))
+        normalized_projections = [
+            company.projected_intensities[scope].projections for company, scope, _ in to_normalize
+        ]
+        if converted:
+            magnitudes = [normalized_projections[i].values.quantity.m for i, _ in converted]
+            lengths = [len(m) for m in magnitudes]
+            converted_m = np.concatenate(magnitudes) * np.repeat([factor for _, factor in converted], lengths)
+            for (i, _), m in zip(converted, np.split(converted_m, np.cumsum(lengths)[:-1])):
+                projections = normalized_projections[i]
+                normalized_projections[i] = pd.Series(
+                    PA_(m, dtype=f"pint[{bm_ei_units[to_normalize[i][2]]}]"),
+                    index=projections.index,
+                    name=projections.name,
+                )
+        for (company, scope, sector_region), projections in zip(to_normalize, normalized_projections):
+            setattr(
+                company.projected_intensities,
+                scope,
+                DF_ICompanyEIProjections(ei_metric=str(bm_ei_units[sector_region]), projections=projections),
+            )
         logger.info("Done normalizing intensity metrics")
         self._companies = companies
 
@@ -940,153 +1243,145 @@ class BaseCompanyDataProvider(CompanyDataProvider):
         """
         logger.info("Allocating emissions to align with benchmark data")
         bm_ei_df_t = benchmarks_projected_ei._get_intensity_benchmarks()
-        bm_sectors = bm_ei_df_t.columns.get_level_values("sector").unique().to_list()
+        bm_sectors = set(bm_ei_df_t.columns.get_level_values("sector"))
+        bm_sector_regions = set(bm_ei_df_t.columns.droplevel("scope"))
         base_year = self.get_projection_controls().BASE_YEAR
 
-        from collections import defaultdict
-
-        sectors_dict = defaultdict(list)
+        company_dict = {}
         region_dict = {}
-        historic_dict = {}
-
         for c in new_companies:
             orig_id, sector = c.company_id.split("+")
-            if sector in bm_sectors:
-                sectors_dict[orig_id].append(sector)
-            else:
+            if sector not in bm_sectors:
                 logger.error(f"No benchmark sector data for {orig_id}: sector = {sector}")
                 continue
-            if (sector, c.region) in bm_ei_df_t.columns:
+            if (sector, c.region) in bm_sector_regions:
                 region_dict[orig_id] = c.region
-            elif (sector, "Global") in bm_ei_df_t.columns:
+            elif (sector, "Global") in bm_sector_regions:
                 region_dict[orig_id] = "Global"
             else:
                 logger.error(f"No benchmark region data for {orig_id}: sector = {sector}; region = {c.region}")
                 continue
-
             # Though we mutate below, it's our own unique copy of c.historic_data we are mutating, so OK
-            historic_dict[c.company_id] = c.historic_data
-
-        for orig_id, sectors in sectors_dict.items():
-            region = region_dict[orig_id]
-            sector_ei = [
-                (
-                    sector,
-                    scope,
-                    bm_ei_df_t.loc[:, (sector, region, scope)][base_year],
-                )
-                for scope in EScope.get_result_scopes()
-                for sector in sectors
-                if (sector, region, scope) in bm_ei_df_t.columns
-                and ((new_id := "+".join([orig_id, sector])), scope.name) in self._bm_allocation_index
-                and historic_dict[new_id].emissions[scope.name]
-            ]
-            if sector_ei == []:
-                continue
-            sector_ei_df = pd.DataFrame(sector_ei, columns=["sector", "scope", "ei"]).set_index(["sector"])
-            sector_prod_df = pd.DataFrame(
+            company_dict[c.company_id] = c
+
+        if self._bm_allocation_index.empty or not company_dict:
+            # No allocations to make for any companies
+            logger.info("Sector alignment complete")
+            return
+
+        # One row per (split company, scope) that needs a share of its parent's aggregated emissions
+        result_scope_names = [scope.name for scope in EScope.get_result_scopes()]
+        alloc_df = self._bm_allocation_index.to_frame(index=False)
+        alloc_df.columns = ["company_id", "scope"]
+        alloc_df = alloc_df[
+            alloc_df.company_id.isin(company_dict.keys()) & alloc_df.scope.isin(result_scope_names)
+        ].drop_duplicates()
+        alloc_df = alloc_df[
+            [bool(company_dict[c_id].historic_data.emissions[scope_name]) for c_id, scope_name in alloc_df.values]
+        ]
+        if alloc_df.empty:
+            # None of the split companies has emissions to allocate
+            logger.info("Sector alignment complete")
+            return
+        alloc_df[["orig_id", "sector"]] = alloc_df.company_id.str.split("+", expand=True).values
+        alloc_df["region"] = alloc_df.orig_id.map(region_dict)
+        alloc_df["scope"] = alloc_df.scope.map(EScope.__getitem__)
+
+        # Benchmark intensities at BASE_YEAR, one row per (sector, region, scope)
+        bm_ei_base = bm_ei_df_t.loc[base_year]
+        bm_ei_base_df = pd.DataFrame(
+            {
+                "ei": [ei.m for ei in bm_ei_base.values],
+                "ei_unit": [str(ei.u) for ei in bm_ei_base.values],
+            },
+            index=bm_ei_base.index,
+        ).reset_index()
+        alloc_df = alloc_df.merge(bm_ei_base_df, on=["sector", "region", "scope"])
+
+        base_year_prod = {
+            c_id: next(
+                (p.value for p in company_dict[c_id].historic_data.productions if p.year == base_year),
+                None,
+            )
+            for c_id in alloc_df.company_id.unique()
+        }
+        no_prod = [c_id for c_id, prod in base_year_prod.items() if prod is None]
+        if no_prod:
+            logger.warning(f"No {base_year} production to allocate emissions for company_ids {no_prod}")
+            alloc_df = alloc_df[~alloc_df.company_id.isin(no_prod)]
+            if alloc_df.empty:
+                logger.info("Sector alignment complete")
+                return
+        alloc_df["prod"] = [base_year_prod[c_id].m for c_id in alloc_df.company_id]
+        alloc_df["prod_unit"] = [str(base_year_prod[c_id].u) for c_id in alloc_df.company_id]
+
+        # Benchmark-weighted sector emissions, converted to a common unit one (EI, production) unit pair at a time
+        alloc_df["em"] = np.nan
+        for (ei_unit, prod_unit), group in alloc_df.groupby(["ei_unit", "prod_unit"]):
+            alloc_df.loc[group.index, "em"] = (
+                Q_(group["ei"].values * group["prod"].values, ureg.Unit(ei_unit) * ureg.Unit(prod_unit)).to("Mt CO2e").m
+            )
+        # The alignment calculation: Company Scope-Sector emissions = Total Company Scope emissions * (BM Scope Sector / SUM(All Scope Sectors of Company))
+        alloc_df["em_tot"] = alloc_df.groupby(["orig_id", "scope"])["em"].transform("sum")
+        alloc_df = alloc_df[alloc_df.em_tot != 0.0]
+        if alloc_df.empty:
+            logger.info("Sector alignment complete")
+            return
+
+        # Flatten all historic emissions to be reallocated so we can rescale them in bulk
+        historic_list = [company_dict[c_id].historic_data for c_id in alloc_df.company_id]
+        scope_list = alloc_df.scope.to_list()
+        em_realizations = [historic.emissions[scope.name] for historic, scope in zip(historic_list, scope_list)]
+        em_bounds = np.cumsum([0] + [len(ems) for ems in em_realizations])
+        em_row = np.repeat(np.arange(len(em_realizations)), np.diff(em_bounds))
+        em_flat = [em for ems in em_realizations for em in ems]
+        em_m = np.array([em.value.m for em in em_flat])
+        em_units = np.array([str(em.value.u) for em in em_flat])
+        em_share = em_m * alloc_df["em"].values[em_row] / alloc_df["em_tot"].values[em_row]
+        for em_unit in np.unique(em_units):
+            unit_mask = em_units == em_unit
+            em_share[unit_mask] = Q_(em_share[unit_mask], em_unit).to("Mt CO2e").m
+
+        # Emissions intensities pair (positionally) with historic productions
+        prod_list = [historic.productions for historic in historic_list]
+        ei_len = [min(len(ems), len(prods)) for ems, prods in zip(em_realizations, prod_list)]
+        ei_em_pos = np.concatenate([np.arange(em_bounds[i], em_bounds[i] + n) for i, n in enumerate(ei_len)])
+        prod_flat = [prod.value for prods, n in zip(prod_list, ei_len) for prod in prods[:n]]
+        prod_m = np.array([np.nan if prod is None else prod.m for prod in prod_flat])
+        prod_units = np.array(["dimensionless" if prod is None else str(prod.u) for prod in prod_flat])
+        ei_m = em_share[ei_em_pos] / np.where(prod_m == 0.0, np.nan, prod_m)
+        ei_values = np.empty(len(ei_m), dtype=object)
+        for prod_unit in np.unique(prod_units):
+            unit_mask = prod_units == prod_unit
+            # Assigned one by one so that numpy does not try (and warn) to strip the units of a list of Quantities
+            for pos, ei in zip(
+                np.flatnonzero(unit_mask), Q_(ei_m[unit_mask], ureg.Unit("Mt CO2e") / ureg.Unit(prod_unit))
+            ):
+                ei_values[pos] = ei
+
+        em_values = list(Q_(em_share, "Mt CO2e"))
+        ei_bounds = np.cumsum([0] + ei_len)
+        for i, (historic, scope) in enumerate(zip(historic_list, scope_list)):
+            setattr(
+                historic.emissions,
+                scope.name,
                 [
-                    (sector, prod.value)
-                    for sector in sectors
-                    for prod in historic_dict["+".join([orig_id, sector])].productions
-                    # FIXME: if we don't have proudction values for BASE_YEAR, this fails!  See 'US2333311072+Gas Utilities'
-                    if prod.year == base_year
+                    IEmissionRealization(year=em.year, value=value)
+                    for em, value in zip(
+                        em_flat[em_bounds[i] : em_bounds[i + 1]], em_values[em_bounds[i] : em_bounds[i + 1]]
+                    )
                 ],
-                columns=["sector", "prod"],
-            ).set_index("sector")
-            sector_em_df = (
-                sector_ei_df.join(sector_prod_df)
-                .assign(em=lambda x: x["ei"] * x["prod"])
-                .set_index("scope", append=True)
-                .drop(columns=["ei", "prod"])
             )
-            # Only now can we drop whatever is not in self.company_data._bm_allocation_index from sector_em_df
-            if self._bm_allocation_index.empty:
-                # No allocations to make for any companies
-                continue
-            to_allocate_idx = self._bm_allocation_index[
-                self._bm_allocation_index.map(lambda x: x[0].startswith(orig_id))
-            ].map(lambda x: (x[0].split("+")[1], EScope[x[1]]))
-            if to_allocate_idx.empty:
-                logger.info(f"Already allocated emissions for {orig_id} across {sectors}")
-                continue
-            # FIXME: to_allocate_idx is missing S1S2S3 for US2091151041
-            to_allocate_idx.names = ["sector", "scope"]
-            try:
-                sector_em_df = sector_em_df.loc[sector_em_df.index.intersection(to_allocate_idx)].astype(
-                    "pint[Mt CO2e]"
-                )
-            except DimensionalityError:
-                # breakpoint()
-                assert False
-            em_tot = sector_em_df.groupby("scope")["em"].sum()
-            # The alignment calculation: Company Scope-Sector emissions = Total Company Scope emissions * (BM Scope Sector / SUM(All Scope Sectors of Company))
-            aligned_em = [
-                (
-                    sector,
-                    [
-                        (
-                            scope,
-                            list(
-                                map(
-                                    lambda em: (
-                                        em[0],
-                                        em[1]
-                                        * sector_em_df.loc[(sector, scope)].squeeze()
-                                        / em_tot.loc[scope].squeeze(),
-                                    ),
-                                    [
-                                        (em.year, em.value)
-                                        for em in historic_dict["+".join([orig_id, sector])].emissions[scope.name]
-                                    ],
-                                )
-                            ),
-                        )
-                        for scope in em_tot.index
-                        if em_tot.loc[scope].squeeze().m != 0.0
-                    ],
-                )
-                for sector in sectors
-            ]
-
-            # Having done all scopes and sectors for this company above,
-            # replace historic Em and EI data below
-            for sector_aligned in aligned_em:
-                sector, scopes = sector_aligned
-                historic_sector = historic_dict["+".join([orig_id, sector])]
-                assert historic_sector is not None
-                # print(f"Historic {sector} initially\n{historic_sector.emissions}")
-                for scope_tuple in scopes:
-                    scope, em_list = scope_tuple
-                    setattr(
-                        historic_sector.emissions,
-                        scope.name,
-                        list(
-                            map(
-                                lambda em: IEmissionRealization(year=em[0], value=em[1].to("Mt CO2e")),
-                                em_list,
-                            )
-                        ),
-                    )
-                    prod_list = historic_sector.productions
-                    ei_list = list(
-                        map(
-                            lambda em_p: IEIRealization(
-                                year=em_p[0].year,
-                                value=(
-                                    Q_(
-                                        np.nan,
-                                        f"({em_p[0].value.u}) / ({em_p[1].value.u})",  # type: ignore
-                                    )
-                                    if em_p[1].value.m == 0.0  # type: ignore
-                                    else em_p[0].value / em_p[1].value
-                                ),
-                            ),
-                            zip(historic_sector.emissions[scope.name], prod_list),
-                        )
+            setattr(
+                historic.emissions_intensities,
+                scope.name,
+                [
+                    IEIRealization(year=em.year, value=value)
+                    for em, value in zip(
+                        em_flat[em_bounds[i] : em_bounds[i] + ei_len[i]], ei_values[ei_bounds[i] : ei_bounds[i + 1]]
                     )
-                    setattr(historic_sector.emissions_intensities, scope.name, ei_list)
-                # print(f"Historic {sector} adjusted\n{historic_dict['+'.join([orig_id, sector])].emissions}")
+                ],
+            )
         logger.info("Sector alignment complete")
 
 
@@ -1144,227 +1439,378 @@ class EITrajectoryProjector(EIProjector):
         self._EI_df_t = pd.DataFrame() if ei_df_t is None else ei_df_t
 
     def project_ei_trajectories(self, companies: List[ICompanyData], backfill_needed=True) -> List[ICompanyData]:
-        historic_df = self._extract_historic_df(companies)
-        # This modifies historic_df in place...which feeds the intensity extrapolations below
-        self._align_and_compute_missing_historic_ei(companies, historic_df)
-        historic_years = [column for column in historic_df.columns if isinstance(column, int)]
-        projection_years = range(max(historic_years), self.projection_controls.TARGET_YEAR + 1)
-        with warnings.catch_warnings():
-            # Don't worry about warning that we are intentionally dropping units as we transpose
-            warnings.simplefilter("ignore")
-            historic_ei_t = asPintDataFrame(
-                historic_df[historic_years].query(f"variable=='{VariablesConfig.EMISSIONS_INTENSITIES}'").T
-            ).pint.dequantify()
-            historic_ei_t.index.name = "year"
+        chunk_size = self.projection_controls.PROJECTION_CHUNK_SIZE
+        if not chunk_size or len(companies) <= chunk_size:
+            return self._project_ei_trajectories(companies, backfill_needed)
+        # Stream companies through the projector so that peak memory is proportional to CHUNK_SIZE.
+        # Every chunk is projected over the same grid of years as the whole universe: otherwise a chunk's
+        # backfills and extrapolations would depend on which other companies happened to be in it.
+        historic_years = self._historic_years(companies)
+        if not historic_years:
+            logger.error(f"No historic data for companies: {[c.company_id for c in companies]}")
+            raise ValueError("No historic data anywhere")
+        for start in range(0, len(companies), chunk_size):
+            chunk = companies[start : start + chunk_size]
+            if not self._historic_years(chunk):
+                # Nothing to project, just as if these companies were part of a larger universe
+                for company in chunk:
+                    company.projected_intensities = ICompanyEIProjectionsScopes()
+                continue
+            self._project_ei_trajectories(chunk, backfill_needed, historic_years)
+        return companies
+
+    def _project_ei_trajectories(
+        self, companies: List[ICompanyData], backfill_needed=True, historic_years: Optional[List[int]] = None
+    ) -> List[ICompanyData]:
+        historic_ei_t = self._get_historic_ei_t(companies, historic_years)
         if backfill_needed:
-            # Fill in gaps between BASE_YEAR and the first data we have
-            if ITR.HAS_UNCERTAINTIES:
-                historic_ei_t = historic_ei_t.map(lambda x: np.nan if ITR.isna(x) else x)
-            backfilled_t = historic_ei_t.bfill(axis=0)
-            # FIXME: this hack causes backfilling only on dates on or after the
-            # first year of the benchmark, which keeps it from disrupting current test cases
-            # while also working on real-world use cases.  But we need to formalize this decision.
-            backfilled_t = backfilled_t.reset_index()
-            backfilled_t = backfilled_t.where(
-                backfilled_t.year >= self.projection_controls.BASE_YEAR,
-                historic_ei_t.reset_index(),
+            historic_ei_t = self._backfill_to_base_year(companies, historic_ei_t)
+        self._add_projections_to_companies(companies, self._project_historic_ei(historic_ei_t))
+        return companies
+
+    def project_ei_trajectory_variants(
+        self, companies: List[ICompanyData], variants: List[ProjectionControls], backfill_needed=True
+    ) -> pd.DataFrame:
+        """
+        Project the trajectories of COMPANIES under each of the ProjectionControls in VARIANTS.  Historic data is
+        extracted and aligned only once and shared by all variants.  Unlike `project_ei_trajectories`,
+        COMPANIES are not modified.
+
+        :param companies: the companies to project
+        :param variants: the ProjectionControls of each variant
+        :param backfill_needed: whether to backfill historic intensities to each variant's BASE_YEAR
+        :return: a DataFrame of intensity magnitudes with one column per YEAR (covering all variants), indexed
+            by variant (position in VARIANTS), COMPANY_ID, SCOPE, and unit.  Rows form the full
+            (variant, company, scope) grid in order, so `.to_numpy().reshape(len(variants), len(companies),
+            len(EScope.get_scopes()), -1)` is the stacked array.  Scopes without projections are NaN with
+            unit `No Unit`.
+        """
+        scopes = [EScope[scope_name] for scope_name in EScope.get_scopes()]
+        years = range(
+            min(variant.BASE_YEAR for variant in variants), max(variant.TARGET_YEAR for variant in variants) + 1
+        )
+        historic_ei_t = self._get_historic_ei_t(companies)
+        stacked = None
+        units = np.full((len(companies), len(scopes)), NO_UNIT, dtype=object)
+        for v, variant in enumerate(variants):
+            projector = EITrajectoryProjector(variant, self._EI_df_t)
+            variant_ei_t = projector._backfill_to_base_year([], historic_ei_t) if backfill_needed else historic_ei_t
+            projections, projection_units, rows, projection_years = projector._get_projections_matrix(
+                companies, projector._project_historic_ei(variant_ei_t)
             )
-            backfilled_t.set_index("year", inplace=True)
-            if not historic_ei_t.compare(backfilled_t).empty:
-                logger.warning(
-                    f"some data backfilled to {self.projection_controls.BASE_YEAR} for company_ids in list \
-                    {historic_ei_t.compare(backfilled_t).columns.get_level_values('company_id').unique().tolist()}"
-                )
-                historic_ei_t = backfilled_t.sort_index(axis=1)
-                for company in companies:
-                    if ITR.isna(company.base_year_production):
-                        # If we have no valid production data, we cannot use EI data to compute emissions
-                        continue
-                    for ghg_attr, ghg_scope in [
-                        (ColumnsConfig.GHG_SCOPE3, EScope.S3),
-                        (ColumnsConfig.GHG_SCOPE12, EScope.S1S2),
-                    ]:
-                        if ITR.isna(getattr(company, ghg_attr)):
-                            try:
-                                idx = (company.company_id, "Emissions Intensities", ghg_scope)
-                                setattr(
-                                    company,
-                                    ghg_attr,
-                                    Q_(
-                                        historic_ei_t[idx].loc[self.projection_controls.BASE_YEAR].squeeze(),
-                                        historic_ei_t[idx].columns[0],
-                                    )
-                                    * company.base_year_production,
-                                )
-                            except KeyError:
-                                # If it's not there, we'll complain later
-                                pass
+            if stacked is None:
+                stacked = np.full((len(variants), len(companies), len(scopes), len(years)), np.nan, projections.dtype)
+            company_idx, scope_idx = np.nonzero(rows >= 0)
+            year_idx = np.asarray(projection_years) - years.start
+            stacked[v, company_idx[:, np.newaxis], scope_idx[:, np.newaxis], year_idx] = projections[
+                rows[company_idx, scope_idx]
+            ]
+            units[company_idx, scope_idx] = projection_units[rows[company_idx, scope_idx]]
+        assert stacked is not None
+        index = pd.MultiIndex.from_product(
+            [range(len(variants)), [company.company_id for company in companies], scopes],
+            names=["variant", ColumnsConfig.COMPANY_ID, ColumnsConfig.SCOPE],
+        )
+        return pd.DataFrame(
+            stacked.reshape(len(index), len(years)),
+            index=pd.MultiIndex.from_arrays(
+                [*[index.get_level_values(i) for i in range(index.nlevels)], np.tile(units.ravel(), len(variants))],
+                names=[*index.names, "unit"],
+            ),
+            columns=pd.Index(years, name="year"),
+        )
+
+    def _get_historic_ei_t(
+        self, companies: List[ICompanyData], historic_years: Optional[List[int]] = None
+    ) -> pd.DataFrame:
+        """
+        Return the dequantified (years x series) historic emissions intensities of COMPANIES, including those
+        computed from historic emissions and production.
+        """
+        historic_df = self._extract_historic_df(companies, historic_years)
+        # This adds computed intensities to historic_df...which feeds the intensity extrapolations
+        historic_df = self._align_and_compute_missing_historic_ei(companies, historic_df)
+        historic_years = [column for column in historic_df.columns if isinstance(column, int)]
+        # Historic data is already dequantified, with units in the last level of the index
+        historic_ei_t = historic_df[historic_years].query(f"variable=='{VariablesConfig.EMISSIONS_INTENSITIES}'").T
+        historic_ei_t.index.name = "year"
+        return historic_ei_t
+
+    def _project_historic_ei(self, historic_ei_t: pd.DataFrame) -> pd.DataFrame:
+        """
+        Standardize HISTORIC_EI_T, compute trends, and extrapolate them through TARGET_YEAR.
+        """
+        projection_years = range(max(historic_ei_t.index), self.projection_controls.TARGET_YEAR + 1)
         standardized_ei_t = self._standardize(historic_ei_t)
         intensity_trends_t = self._get_trends(standardized_ei_t)
         extrapolated_t = self._extrapolate(intensity_trends_t, projection_years, historic_ei_t)
         # Restrict projection to benchmark years
-        extrapolated_t = extrapolated_t[extrapolated_t.index >= self.projection_controls.BASE_YEAR]
-        # Restore row-wise shape of DataFrame
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            # pint units don't like being twisted from columns to rows, but it's ok
-            self._add_projections_to_companies(companies, extrapolated_t.pint.quantify())
-        return companies
+        return extrapolated_t[extrapolated_t.index >= self.projection_controls.BASE_YEAR]
+
+    def _backfill_to_base_year(self, companies: List[ICompanyData], historic_ei_t: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fill in gaps between BASE_YEAR and the first data we have in HISTORIC_EI_T (a dequantified
+        years x series DataFrame).  Companies missing base year emissions get them from the backfilled
+        intensities times their base year production.
+        """
+        nan_mask = np.isnan(self._nominal_values_matrix(historic_ei_t))
+        n_years = len(historic_ei_t)
+        next_valid = np.minimum.accumulate(
+            np.where(nan_mask, n_years, np.arange(n_years)[:, np.newaxis])[::-1], axis=0
+        )[::-1]
+        # FIXME: this hack causes backfilling only on dates on or after the
+        # first year of the benchmark, which keeps it from disrupting current test cases
+        # while also working on real-world use cases.  But we need to formalize this decision.
+        backfill = (
+            nan_mask
+            & (next_valid < n_years)
+            & (historic_ei_t.index >= self.projection_controls.BASE_YEAR)[:, np.newaxis]
+        )
+        values = historic_ei_t.to_numpy(copy=True)
+        if values.dtype == object:
+            # Canonicalize NaNs (which may be UFloat NaNs) before backfilling
+            values[nan_mask] = np.nan
+            historic_ei_t = pd.DataFrame(values.copy(), index=historic_ei_t.index, columns=historic_ei_t.columns)
+        if not backfill.any():
+            return historic_ei_t
+        logger.warning(
+            f"some data backfilled to {self.projection_controls.BASE_YEAR} for company_ids in list \
+            {historic_ei_t.columns[backfill.any(axis=0)].get_level_values('company_id').unique().tolist()}"
+        )
+        rows, cols = np.nonzero(backfill)
+        values[rows, cols] = values[next_valid[rows, cols], cols]
+        historic_ei_t = pd.DataFrame(values, index=historic_ei_t.index, columns=historic_ei_t.columns).sort_index(
+            axis=1
+        )
+        if self.projection_controls.BASE_YEAR not in historic_ei_t.index:
+            # If it's not there, we'll complain later
+            return historic_ei_t
 
-    def _extract_historic_df(self, companies: List[ICompanyData]) -> pd.DataFrame:
-        data = []
+        # If we have no valid production data, we cannot use EI data to compute emissions
+        fill_companies, fill_attrs, fill_keys = [], [], []
         for company in companies:
-            if company.historic_data.empty:
+            if ITR.isna(company.base_year_production):
                 continue
-            c_hd = company.historic_data
-            if len(c_hd.productions):
-                data.append(self._historic_productions_to_dict(company.company_id, c_hd.productions))
-            if not c_hd.emissions.empty:
-                data.extend(self._historic_emissions_to_dicts(company.company_id, c_hd.emissions))
-            if not c_hd.emissions_intensities.empty:
-                data.extend(self._historic_ei_to_dicts(company.company_id, c_hd.emissions_intensities))
-        if not data:
+            for ghg_attr, ghg_scope in [
+                (ColumnsConfig.GHG_SCOPE3, EScope.S3),
+                (ColumnsConfig.GHG_SCOPE12, EScope.S1S2),
+            ]:
+                if ITR.isna(getattr(company, ghg_attr)):
+                    fill_companies.append(company)
+                    fill_attrs.append(ghg_attr)
+                    fill_keys.append((company.company_id, VariablesConfig.EMISSIONS_INTENSITIES, ghg_scope))
+        if not fill_keys:
+            return historic_ei_t
+        # If it's not there, we'll complain later
+        fill_pos = historic_ei_t.columns.droplevel(-1).get_indexer(pd.MultiIndex.from_tuples(fill_keys))
+        base_year_ei = historic_ei_t.loc[self.projection_controls.BASE_YEAR].to_numpy()
+        ei_units = historic_ei_t.columns.get_level_values(-1)
+        fillable = np.flatnonzero(fill_pos >= 0)
+        production_units = [str(fill_companies[i].base_year_production.u) for i in fillable]
+        for (ei_unit, production_unit), idx in (
+            pd.Series(fillable).groupby([ei_units[fill_pos[fillable]], production_units]).indices.items()
+        ):
+            base_year_emissions = Q_(base_year_ei[fill_pos[fillable[idx]]], ei_unit) * Q_(
+                np.array([fill_companies[i].base_year_production.m for i in fillable[idx]]), production_unit
+            )
+            for i, emissions in zip(fillable[idx], base_year_emissions):
+                setattr(fill_companies[i], fill_attrs[i], emissions)
+        return historic_ei_t
+
+    def _extract_historic_df(
+        self, companies: List[ICompanyData], historic_years: Optional[List[int]] = None
+    ) -> pd.DataFrame:
+        """
+        Extract historic productions, emissions, and emissions intensities into a single DataFrame indexed by
+        COMPANY_ID, VARIABLE, SCOPE, and unit (the same `unit` level created by `pint.dequantify`).  Columns are
+        YEARs and values are magnitudes in the unit of their row, so transposed slices are ready for projection
+        without ever creating Quantity-valued cells.
+
+        :param companies: the companies whose historic data is extracted
+        :param historic_years: the YEAR columns of the result; by default, all years found in the historic data
+        """
+        keys: List[tuple] = []
+        row_idx: List[int] = []
+        years: List[int] = []
+        magnitudes: List[Any] = []
+
+        for company_id, variable, scope, realizations in self._historic_rows(companies):
+            row = self._historic_realizations_to_row(realizations)
+            if row is None:
+                continue
+            unit, row_years, row_magnitudes = row
+            row_idx.extend([len(keys)] * len(row_years))
+            years.extend(row_years)
+            magnitudes.extend(row_magnitudes)
+            keys.append((company_id, variable, scope, unit))
+        if not keys:
             logger.error(f"No historic data for companies: {[c.company_id for c in companies]}")
             raise ValueError("No historic data anywhere")
-        df = pd.DataFrame.from_records(data).set_index(
-            [ColumnsConfig.COMPANY_ID, ColumnsConfig.VARIABLE, ColumnsConfig.SCOPE]
+
+        # Scatter all magnitudes into a (rows x years) matrix in one step.  Without uncertainties this is float64.
+        year_columns = np.unique(years) if historic_years is None else np.asarray(historic_years)
+        flat_magnitudes = np.asarray(magnitudes)
+        if flat_magnitudes.dtype.kind in "iu":
+            flat_magnitudes = flat_magnitudes.astype(np.float64)
+        data = np.full((len(keys), len(year_columns)), np.nan, dtype=flat_magnitudes.dtype)
+        data[np.asarray(row_idx, dtype=np.intp), np.searchsorted(year_columns, years)] = flat_magnitudes
+        return pd.DataFrame(
+            data,
+            index=pd.MultiIndex.from_tuples(
+                keys, names=[ColumnsConfig.COMPANY_ID, ColumnsConfig.VARIABLE, ColumnsConfig.SCOPE, "unit"]
+            ),
+            columns=pd.Index(year_columns.tolist()),
         )
 
-        # Note that the first valid index may well be Quantity with a NaN value--that's fine
-        # We just need to fill in the pure NaNs that arise from very ragged data
-        with warnings.catch_warnings():
-            # TODO: need to investigate whether there is a more sane way to avoid unit warnings
-            warnings.simplefilter("ignore")
-            df_first_valid = df.apply(lambda x: x[x.first_valid_index()], axis=1)
-        df_filled = df.fillna(df.apply(lambda x: df_first_valid.map(lambda y: Q_(np.nan, y.u))))
-        return df_filled
-
-    def _historic_productions_to_dict(self, id: str, productions: List[IProductionRealization]) -> Dict[Any, Any]:
-        """
-        Construct a dictionary that will later turned into a DataFrame indexed by COMAPNY_ID, VARIABLE, and SCOPE.
-        In this case (Production), scope is 'Production'.
-        Columns are YEARs and values are Quantiities.
-        """
-        prods = {prod.year: prod.value for prod in productions}
-        return {
-            ColumnsConfig.COMPANY_ID: id,  # type: ignore
-            ColumnsConfig.VARIABLE: VariablesConfig.PRODUCTIONS,  # type: ignore
-            ColumnsConfig.SCOPE: "Production",  # type: ignore
-            **prods,
-        }
+    def _historic_rows(self, companies: List[ICompanyData]):
+        """
+        Generate the (COMPANY_ID, VARIABLE, SCOPE, realizations) of each row of historic data of COMPANIES.
+        """
+        for company in companies:
+            if company.historic_data.empty:
+                continue
+            c_hd = company.historic_data
+            if len(c_hd.productions):
+                yield company.company_id, VariablesConfig.PRODUCTIONS, "Production", c_hd.productions
+            for variable, scopes in [
+                (VariablesConfig.EMISSIONS, c_hd.emissions),
+                (VariablesConfig.EMISSIONS_INTENSITIES, c_hd.emissions_intensities),
+            ]:
+                for scope_name, realizations in dict(scopes).items():
+                    if realizations:
+                        yield company.company_id, variable, EScope[scope_name], realizations
 
-    def _historic_emissions_to_dicts(self, id: str, emissions_scopes: IHistoricEmissionsScopes) -> List[Dict[Any, Any]]:
+    def _historic_years(self, companies: List[ICompanyData]) -> List[int]:
         """
-        Construct a dictionary that will later turned into a DataFrame indexed by COMAPNY_ID, VARIABLE, and SCOPE.
-        In this case (Emissions), scopes are 'S1', 'S2', 'S3', 'S1S2', and 'S1S2S3'.
-        Columns are YEARs and values are Quantiities.
+        Return the sorted YEARs of all the historic data that `_extract_historic_df` would extract from COMPANIES.
         """
-        data = []
-        for scope, emissions in dict(emissions_scopes).items():
-            if emissions:
-                ems = {em["year"]: em["value"] for em in emissions}
-                data.append(
-                    {
-                        ColumnsConfig.COMPANY_ID: id,
-                        ColumnsConfig.VARIABLE: VariablesConfig.EMISSIONS,
-                        ColumnsConfig.SCOPE: EScope[scope],
-                        **ems,
-                    }
-                )
-        return data
-
-    def _historic_ei_to_dicts(self, id: str, intensities_scopes: IHistoricEIScopes) -> List[Dict[Any, Any]]:
-        data = []
-        for scope, intensities in dict(intensities_scopes).items():
-            if intensities:
-                intsties = {intsty["year"]: intsty["value"] for intsty in intensities}
-                data.append(
-                    {
-                        ColumnsConfig.COMPANY_ID: id,
-                        ColumnsConfig.VARIABLE: VariablesConfig.EMISSIONS_INTENSITIES,
-                        ColumnsConfig.SCOPE: EScope[scope],
-                        **intsties,
-                    }
-                )
-        return data
+        years = set()
+        for _, _, _, realizations in self._historic_rows(companies):
+            if any(realization.value is not None for realization in realizations):
+                years.update(realization.year for realization in realizations)
+        return sorted(years)
+
+    def _historic_realizations_to_row(self, realizations: List[Any]) -> Optional[tuple]:
+        """
+        Convert a list of IProductionRealization, IEmissionRealization, or IEIRealization into the
+        unit, years, and magnitudes of a single row of the historic DataFrame.
+        Arbitrarily pick the first of the most popular units, as `asPintSeries` does.
+        """
+        quantities = [realization.value for realization in realizations if realization.value is not None]
+        if not quantities:
+            return None
+        unit_counts: Dict[Any, int] = {}
+        for qty in quantities:
+            if not ITR.isna(qty.m):
+                unit_counts[qty.u] = unit_counts.get(qty.u, 0) + 1
+        unit = max(unit_counts, key=unit_counts.__getitem__) if unit_counts else quantities[0].u
+        row_magnitudes = [
+            (
+                np.nan
+                if realization.value is None or ITR.isna(realization.value.m)
+                else realization.value.m if realization.value.u == unit else realization.value.to(unit).m
+            )
+            for realization in realizations
+        ]
+        return (
+            format(unit, ureg.default_format),
+            [realization.year for realization in realizations],
+            row_magnitudes,
+        )
 
     # Each benchmark defines its own scope requirements on a per-sector/per-region basis.
     # The benchmark EI metrics (t CO2e/GJ) may not align with disclosed EI (t CO2/ CH4 / bcm)
     # So we both align the disclosed EI data to the benchmark metrics, and we fill data
     # gaps where EI can be immediately computed from emissions and production metrics.
     # No fancy estimations or allocations here.
-    def _align_and_compute_missing_historic_ei(self, companies: List[ICompanyData], historic_df: pd.DataFrame):
+    def _align_and_compute_missing_historic_ei(
+        self, companies: List[ICompanyData], historic_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Return HISTORIC_DF extended with emissions intensities computed from emissions and production
+        wherever a company discloses emissions but not emissions intensities for a scope.
+
+        Production is aligned to benchmark units once per (benchmark sector, region, production unit) group,
+        and all missing intensities are then computed with a single matrix division.
+        """
         scopes = [EScope[scope_name] for scope_name in EScope.get_scopes()]
-        missing_data = []
-        misaligned_data = []
-        # https://github.com/pandas-dev/pandas/issues/53053
-        index_names = historic_df.index.names
-        for company in companies:
-            # Create keys to index historic_df DataFrame for readability
-            production_key = (
-                company.company_id,
-                VariablesConfig.PRODUCTIONS,
-                "Production",
+        key_index = historic_df.index.droplevel("unit")
+        row_units = historic_df.index.get_level_values("unit")
+        data = historic_df.to_numpy()
+
+        # Companies without production data are skipped (they may still have disclosed EI data)
+        production_rows = pd.Series(
+            np.arange(len(historic_df)), index=key_index.get_level_values(ColumnsConfig.COMPANY_ID)
+        )[key_index.get_level_values(ColumnsConfig.VARIABLE) == VariablesConfig.PRODUCTIONS]
+        production_rows = production_rows[~production_rows.index.duplicated()]
+        company_info = pd.DataFrame(
+            [(company.company_id, company.sector, company.region) for company in companies],
+            columns=[ColumnsConfig.COMPANY_ID, ColumnsConfig.SECTOR, ColumnsConfig.REGION],
+        ).drop_duplicates(ColumnsConfig.COMPANY_ID)
+        company_info = company_info[company_info[ColumnsConfig.COMPANY_ID].isin(production_rows.index)].reset_index(
+            drop=True
+        )
+        company_info["production_row"] = production_rows.loc[company_info[ColumnsConfig.COMPANY_ID]].to_numpy()
+        company_info["production_unit"] = row_units[company_info["production_row"]]
+        if self._EI_df_t.empty:
+            company_info["bm_region"] = ""
+        else:
+            bm_columns = self._EI_df_t.columns.droplevel(-1).unique()
+            has_region = pd.MultiIndex.from_frame(company_info[[ColumnsConfig.SECTOR, ColumnsConfig.REGION]]).isin(
+                bm_columns
             )
-            emissions_keys = {scope: (company.company_id, VariablesConfig.EMISSIONS, scope) for scope in scopes}
-            ei_keys = {
-                scope: (
-                    company.company_id,
-                    VariablesConfig.EMISSIONS_INTENSITIES,
-                    scope,
-                )
-                for scope in scopes
-            }
-            this_missing_data = []
-            this_misaligned_data: List[str] = []
-            append_this_missing_data = True
+            company_info["bm_region"] = company_info[ColumnsConfig.REGION].where(has_region, "Global")
+
+        aligned_production = np.empty((len(company_info), data.shape[1]), dtype=data.dtype)
+        aligned_units = np.empty(len(company_info), dtype=object)
+        aligned = np.ones(len(company_info), dtype=bool)
+        misaligned_data = []
+        for (sector, bm_region, production_unit), group_idx in company_info.groupby(
+            [ColumnsConfig.SECTOR, "bm_region", "production_unit"], sort=False
+        ).indices.items():
+            group_production = data[company_info["production_row"].to_numpy()[group_idx]]
+            if self._EI_df_t.empty:
+                aligned_production[group_idx] = group_production
+                aligned_units[group_idx] = production_unit
+                continue
+            # This assumes all benchmark scopes have the same units, so we can just choose the first
+            ei_df_t = self._EI_df_t.loc[:, (sector, bm_region)]
             try:
-                aligned_production = asPintSeries(historic_df.loc[production_key])
-            except KeyError:
-                this_missing_data.append(f"{company.company_id} - Production")
+                group_aligned = align_production_to_bm(
+                    pd.Series(PA_(group_production.ravel(), production_unit)), ei_df_t.iloc[0]
+                )
+            except DimensionalityError:
+                aligned[group_idx] = False
+                # We only need one such per company for our error report
+                misaligned_data.extend(
+                    [
+                        f"{company_id} - {production_unit} vs {ei_df_t.iloc[0].dtype.units}"
+                        for company_id in company_info[ColumnsConfig.COMPANY_ID].iloc[group_idx]
+                    ]
+                )
                 continue
-            if self._EI_df_t.empty:
-                pass
-            else:
-                if (company.sector, company.region) in self._EI_df_t.columns:
-                    ei_df_t = self._EI_df_t.loc[:, (company.sector, company.region)]
-                else:
-                    ei_df_t = self._EI_df_t.loc[:, (company.sector, "Global")]
-                # This assumes all benchmark scopes have the same units, so we can just choose the first
-                # and lift this computation out of a loop
-                try:
-                    aligned_production = align_production_to_bm(aligned_production, ei_df_t.iloc[0])
-                except DimensionalityError:
-                    if not this_misaligned_data:
-                        # We only need one such for our error report
-                        this_misaligned_data.append(
-                            f"{company.company_id} - {aligned_production.iloc[0].units} vs {ei_df_t.iloc[0].dtype.units}"
-                        )
-                    continue
-            for scope in scopes:
-                if ei_keys[scope] in historic_df.index:
-                    assert company.historic_data.emissions_intensities[scope.name]
-                    # We could check that our EI calculations agree with our disclosed EI data, but bad reference data in test cases would cause tests to fail
-                    # assert all([historic_df.loc[emissions_keys[scope]].loc[item.year] / aligned_production.loc[item.year] == item.value
-                    #            for item in company.historic_data.emissions_intensities[scope.name] if not pd.isna(item.value)])
-                    append_this_missing_data = False
-                    continue
-                # Emissions intensities not yet computed for this scope
-                try:  # All we will try is computing EI from Emissions / Production
-                    historic_df.loc[ei_keys[scope]] = historic_df.loc[emissions_keys[scope]] / aligned_production
-                    append_this_missing_data = False
-                except KeyError:
-                    this_missing_data.append(f"{company.company_id} - {scope.name}")
-                    continue
-                # Note that we don't actually add new-found data to company.historic data
-                # ...only as the starting point for projections (in historic_df)
-            if this_misaligned_data:
-                misaligned_data.extend(this_misaligned_data)
-            # This only happens if ALL scope data is missing.  If ANY scope data is present, we'll work with what we get.
-            if this_missing_data and append_this_missing_data:
-                missing_data.extend(this_missing_data)
-        # https://github.com/pandas-dev/pandas/issues/53053
-        historic_df.index.names = index_names
+            aligned_production[group_idx] = group_aligned.pint.m.to_numpy().reshape(group_production.shape)
+            aligned_units[group_idx] = format(group_aligned.pint.u, ureg.default_format)
+        company_info = company_info[aligned]
+        aligned_production, aligned_units = aligned_production[aligned], aligned_units[aligned]
+
+        # Boolean (company x scope) matrices of what is disclosed
+        company_ids = company_info[ColumnsConfig.COMPANY_ID].to_numpy()
+        company_pos = np.repeat(np.arange(len(company_ids)), len(scopes))
+        scope_keys = np.tile(np.array(scopes, dtype=object), len(company_ids))
+        ei_keys = pd.MultiIndex.from_arrays(
+            [company_ids[company_pos], [VariablesConfig.EMISSIONS_INTENSITIES] * len(company_pos), scope_keys]
+        )
+        emissions_keys = pd.MultiIndex.from_arrays(
+            [company_ids[company_pos], [VariablesConfig.EMISSIONS] * len(company_pos), scope_keys]
+        )
+        has_ei = ei_keys.isin(key_index)
+        has_emissions = emissions_keys.isin(key_index)
+        compute_ei = ~has_ei & has_emissions
+        # This only happens if ALL scope data is missing.  If ANY scope data is present, we'll work with what we get.
+        no_data = ~(has_ei | has_emissions).reshape(len(company_ids), len(scopes)).any(axis=1)
+        missing_data = [f"{company_id} - {scope.name}" for company_id in company_ids[no_data] for scope in scopes]
+
         if misaligned_data:
             warning_message = f"Ignoring unalignable production metrics with benchmark intensity metrics for these companies: {misaligned_data}"
             logger.warning(warning_message)
@@ -1375,54 +1821,119 @@ class EITrajectoryProjector(EIProjector):
             )
             logger.error(error_message)
             raise ValueError(error_message)
+        if not compute_ei.any():
+            return historic_df
+
+        # All we will try is computing EI from Emissions / Production
+        # Note that we don't actually add new-found data to company.historic data
+        # ...only as the starting point for projections (in historic_df)
+        emissions_rows = key_index.get_indexer(emissions_keys[compute_ei])
+        production_pos = company_pos[compute_ei]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            computed_ei = data[emissions_rows] / aligned_production[production_pos]
+        unit_pairs = pd.MultiIndex.from_arrays([row_units[emissions_rows], aligned_units[production_pos]])
+        ei_units = {
+            (emissions_unit, production_unit): format(
+                ureg.Unit(emissions_unit) / ureg.Unit(production_unit), ureg.default_format
+            )
+            for emissions_unit, production_unit in unit_pairs.unique()
+        }
+        computed_df = pd.DataFrame(
+            computed_ei,
+            index=pd.MultiIndex.from_arrays(
+                [
+                    ei_keys[compute_ei].get_level_values(0),
+                    ei_keys[compute_ei].get_level_values(1),
+                    ei_keys[compute_ei].get_level_values(2),
+                    [ei_units[unit_pair] for unit_pair in unit_pairs],
+                ],
+                names=historic_df.index.names,
+            ),
+            columns=historic_df.columns,
+        )
+        return pd.concat([historic_df, computed_df])
 
     def _add_projections_to_companies(self, companies: List[ICompanyData], extrapolations_t: pd.DataFrame):
-        projection_range = range(self.projection_controls.BASE_YEAR, self.projection_controls.TARGET_YEAR + 1)
-        for company in companies:
-            scope_projections: Dict[str, pd.Series | None] = {}
-            scope_dfs = {}
-            scope_names = EScope.get_scopes()
-            for scope_name in scope_names:
-                if not company.historic_data.emissions_intensities[scope_name]:
-                    scope_projections[scope_name] = None
-                    continue
-                results = extrapolations_t[
-                    (
-                        company.company_id,
-                        VariablesConfig.EMISSIONS_INTENSITIES,
-                        EScope[scope_name],
-                    )
-                ]
-                if not isinstance(results.dtype, PintType):
-                    if results.isna().all():
-                        # Pure NaN results (not Quantity(nan)) likely constructed from degenerate test case
-                        scope_projections[scope_name] = None
-                        continue
-                    assert False
-                # FIXME: is it OK to discard purely NAN results (and change the testsuite accordingly)?
-                # if results.isna().all():
-                #     scope_projections[scope_name] = None
-                #     continue
-                scope_dfs[scope_name] = results
-                scope_projections[scope_name] = results[results.index.isin(projection_range)]
-            if (
-                scope_projections["S1S2"] is None
-                and scope_projections["S1"] is not None
-                and scope_projections["S2"] is not None
-            ):
-                results = scope_dfs["S1"] + scope_dfs["S2"]
-                scope_dfs["S1S2"] = results
-                scope_projections["S1S2"] = results[results.index.isin(projection_range)]
-            if (
-                scope_projections["S1S2S3"] is None
-                and scope_projections["S1S2"] is not None
-                and scope_projections["S3"] is not None
-            ):
-                results = scope_dfs["S1S2"] + scope_dfs["S3"]
-                # We don't need to compute scope_dfs['S1S2S3'] because nothing further depends on accessing it here
-                scope_projections["S1S2S3"] = results[results.index.isin(projection_range)]
+        """
+        Attach projected emissions intensities to COMPANIES.
+
+        :param companies: the companies whose projected_intensities are set
+        :param extrapolations_t: dequantified (years x series) DataFrame whose columns are indexed by
+            COMPANY_ID, VARIABLE, SCOPE, and unit
+        """
+        projections, units, rows, years = self._get_projections_matrix(companies, extrapolations_t)
+        scope_names = EScope.get_scopes()
+        dtypes = {unit: PintType(unit) for unit in set(units)}
+        for i, company in enumerate(companies):
+            scope_projections: Dict[str, pd.Series | None] = {
+                # Each Series is a zero-copy view of its row in the projections matrix
+                scope_name: (
+                    None if row < 0 else pd.Series(PA_(projections[row], dtype=dtypes[units[row]]), index=years)
+                )
+                for scope_name, row in zip(scope_names, rows[i])
+            }
             company.projected_intensities = ICompanyEIProjectionsScopes(**scope_projections)
 
+    def _get_projections_matrix(self, companies: List[ICompanyData], extrapolations_t: pd.DataFrame) -> tuple:
+        """
+        Lay out the projections of COMPANIES for BASE_YEAR through TARGET_YEAR as contiguous rows of one matrix,
+        adding S1+S2 and S1S2+S3 for companies that don't disclose those scopes directly.
+
+        :return: the (series x years) projections matrix, the unit of each of its rows, a (company x scope)
+            matrix of rows (-1 where the company has no projection for the scope), and the index of years
+        """
+        projection_range = range(self.projection_controls.BASE_YEAR, self.projection_controls.TARGET_YEAR + 1)
+        scope_names = EScope.get_scopes()
+        S1, S2, S1S2, S3, S1S2S3 = [
+            scope_names.index(scope_name) for scope_name in ["S1", "S2", "S1S2", "S3", "S1S2S3"]
+        ]
+        columns = extrapolations_t.columns
+        positions = {key: i for i, key in enumerate(columns.droplevel(-1))}
+
+        # Row of each company's projection for each scope, or -1 if the company discloses no intensities for the scope
+        rows = np.full((len(companies), len(scope_names)), -1, dtype=np.intp)
+        for i, company in enumerate(companies):
+            for j, scope_name in enumerate(scope_names):
+                if company.historic_data.emissions_intensities[scope_name]:
+                    rows[i, j] = positions[
+                        (company.company_id, VariablesConfig.EMISSIONS_INTENSITIES, EScope[scope_name])
+                    ]
+        need_s1s2 = (rows[:, S1S2] < 0) & (rows[:, S1] >= 0) & (rows[:, S2] >= 0)
+        need_s1s2s3 = (rows[:, S1S2S3] < 0) & ((rows[:, S1S2] >= 0) | need_s1s2) & (rows[:, S3] >= 0)
+
+        # Slice the projection years once for the whole matrix, with each series laid out contiguously and
+        # room for the S1+S2 and S1S2+S3 sums of companies that don't disclose those scopes directly
+        in_range = extrapolations_t.index.isin(projection_range)
+        years = pd.Index(extrapolations_t.index[in_range], name="year")
+        values = extrapolations_t.to_numpy()
+        projections = np.empty((len(columns) + need_s1s2.sum() + need_s1s2s3.sum(), len(years)), dtype=values.dtype)
+        projections[: len(columns)] = values[in_range].T
+        units = np.empty(len(projections), dtype=object)
+        units[: len(columns)] = columns.get_level_values(-1)
+        next_row = len(columns)
+        for need, (left, right, result) in [(need_s1s2, (S1, S2, S1S2)), (need_s1s2s3, (S1S2, S3, S1S2S3))]:
+            rows[need, result] = np.arange(next_row, next_row + need.sum())
+            next_row += need.sum()
+            self._add_projection_rows(projections, units, rows[need, left], rows[need, right], rows[need, result])
+        return projections, units, rows, years
+
+    def _add_projection_rows(
+        self, projections: np.ndarray, units: np.ndarray, left: np.ndarray, right: np.ndarray, result: np.ndarray
+    ) -> None:
+        """
+        Set rows RESULT of PROJECTIONS to the sums of rows LEFT and RIGHT.  As with PintArray addition,
+        each sum takes the units of its LEFT operand.
+        """
+        if not len(result):
+            return
+        unit_pairs = pd.Series(np.arange(len(result))).groupby([units[left], units[right]]).indices
+        for (left_unit, right_unit), idx in unit_pairs.items():
+            right_values = projections[right[idx]]
+            if right_unit != left_unit:
+                right_values = Q_(right_values, right_unit).to(left_unit).m
+            projections[result[idx]] = projections[left[idx]] + right_values
+            units[result[idx]] = left_unit
+
     def _standardize(self, intensities_t: pd.DataFrame) -> pd.DataFrame:
         # At the starting point, we expect that if we have S1, S2, and S1S2 intensities, that S1+S2 = S1S2
         # After winsorization, this is no longer true, because S1 and S2 will be clipped differently than S1S2.
@@ -1434,88 +1945,89 @@ class EITrajectoryProjector(EIProjector):
         return winsorized_ei_t
 
     def _winsorize(self, historic_ei_t: pd.DataFrame) -> pd.DataFrame:
-        # quantile doesn't handle pd.NA inside Quantity; FIXME: we can use np.nan because not expecting UFloat in input data
-
         # Turns out we have to dequantify here: https://github.com/pandas-dev/pandas/issues/45968
-        # Can try again when ExtensionArrays are supported by `quantile`, `clip`, and friends
+        # Rather than work column by column, we winsorize the whole (years x series) matrix of nominal values
+        # at once, carrying uncertainty error terms (if any) in a parallel matrix.
+        nominal_ei = self._nominal_values_matrix(historic_ei_t)
         if ITR.HAS_UNCERTAINTIES:
             try:
-                nominal_ei_t = historic_ei_t.apply(
-                    lambda col: (
-                        pd.Series(ITR.nominal_values(col.values), index=col.index, name=col.name)
-                        if col.dtype.kind == "O"
-                        else col.astype("float64")
-                    )
-                )
-                err_ei_t = historic_ei_t.apply(
-                    lambda col: pd.Series(ITR.std_devs(col.values), index=col.index, name=col.name)
+                err_ei = np.asarray(
+                    ITR.std_devs(historic_ei_t.astype(object).fillna(np.nan).to_numpy()),
+                    dtype=np.float64,
                 )
             except ValueError:
                 logger.error("ValueError in _winsorize")
                 raise
-        else:
-            # pint.dequantify did all the hard work for us
-            nominal_ei_t = historic_ei_t
-        # See https://github.com/hgrecco/pint-pandas/issues/114
-        lower = nominal_ei_t.quantile(
-            q=self.projection_controls.LOWER_PERCENTILE,
-            axis="index",
-            numeric_only=False,
-        )
-        upper = nominal_ei_t.quantile(
-            q=self.projection_controls.UPPER_PERCENTILE,
-            axis="index",
-            numeric_only=False,
-        )
+        with warnings.catch_warnings():
+            # Series with no data at all have no quantiles; they stay NaN
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            lower = np.nanquantile(nominal_ei, self.projection_controls.LOWER_PERCENTILE, axis=0)
+            upper = np.nanquantile(nominal_ei, self.projection_controls.UPPER_PERCENTILE, axis=0)
         # FIXME: the clipping process can properly introduce uncertainties.  The low and high values that are clipped could be
         # replaced by the clipped values +/- the lower and upper percentile values respectively.
-        winsorized_t: pd.DataFrame = nominal_ei_t.clip(lower=lower, upper=upper, axis="columns")
-        wnom_t = winsorized_t.astype("float64").apply(
-            lambda col: col.interpolate(
-                method="linear",
-                inplace=False,
-                limit_direction="forward",
-                limit_area="inside",
-            )
-        )
+        winsorized = np.clip(nominal_ei, lower, upper)
+        wnom = self._interpolate(winsorized)
+        wnom_t = pd.DataFrame(wnom, index=historic_ei_t.index, columns=historic_ei_t.columns)
         if ITR.HAS_UNCERTAINTIES:
-            werr_t = err_ei_t.apply(
-                lambda col: col.where(
-                    winsorized_t[col.name].notna(),
-                    abs(
-                        (wnom_col := wnom_t[col.name]).shift(1, fill_value=wnom_col.iloc[0])
-                        - wnom_col.shift(-1, fill_value=wnom_col.iloc[-1])
-                    ),
-                )
-            )
-            uwinsorized_t = wnom_t.combine(werr_t, ITR.recombine_nom_and_std)
-            return uwinsorized_t
+            # Interpolated values take the spread of their neighbors as their error term
+            if len(wnom):
+                neighbor_spread = np.abs(np.vstack([wnom[:1], wnom[:-1]]) - np.vstack([wnom[1:], wnom[-1:]]))
+                err_ei = np.where(np.isnan(winsorized), neighbor_spread, err_ei)
+            # As with ITR.recombine_nom_and_std, series without any error terms remain float64
+            uncertain_cols = np.flatnonzero(np.nansum(err_ei, axis=0) != 0)
+            if len(uncertain_cols):
+                unom = wnom[:, uncertain_cols]
+                uwinsorized = ITR.uarray(unom, np.where(np.isnan(unom), 0.0, err_ei[:, uncertain_cols]))
+                # Canonicalize NaNs
+                uwinsorized[np.isnan(unom)] = np.nan
+                wnom_t = wnom_t.astype({wnom_t.columns[i]: object for i in uncertain_cols})
+                wnom_t.iloc[:, uncertain_cols] = uwinsorized
+            return wnom_t
 
         # FIXME: If we have S1, S2, and S1S2 intensities, should we treat winsorized(S1)+winsorized(S2) as winsorized(S1S2)?
         # FIXME: If we have S1S2 (or S1 and S2) and S3 and S1S23 intensities, should we treat winsorized(S1S2)+winsorized(S3) as winsorized(S1S2S3)?
         return wnom_t
 
-    def _interpolate(self, historic_ei_t: pd.DataFrame) -> pd.DataFrame:
-        # Interpolate NaNs surrounded by values, but don't extrapolate NaNs with last known value
-        raise NotImplementedError
+    def _interpolate(self, historic_ei: np.ndarray) -> np.ndarray:
+        """
+        Linearly interpolate NaNs surrounded by values, but don't extrapolate NaNs with last known value.
+
+        :param historic_ei: float64 matrix, one row per year and one column per series
+        :return: a new matrix with inside gaps filled
+        """
+        valid = ~np.isnan(historic_ei)
+        positions = np.arange(len(historic_ei))[:, np.newaxis]
+        # Row position of the last valid value at or before each cell, and of the next valid value at or after it
+        prev_pos = np.maximum.accumulate(np.where(valid, positions, -1), axis=0)
+        next_pos = np.minimum.accumulate(np.where(valid, positions, len(historic_ei))[::-1], axis=0)[::-1]
+        gaps = ~valid & (prev_pos >= 0) & (next_pos < len(historic_ei))
+        interpolated = historic_ei.copy()
+        if gaps.any():
+            rows, cols = np.nonzero(gaps)
+            lo, hi = prev_pos[rows, cols], next_pos[rows, cols]
+            lo_val, hi_val = historic_ei[lo, cols], historic_ei[hi, cols]
+            interpolated[rows, cols] = lo_val + (hi_val - lo_val) * (rows - lo) / (hi - lo)
+        return interpolated
+
+    def _nominal_values_matrix(self, intensities_t: pd.DataFrame) -> np.ndarray:
+        """
+        Return the nominal values of INTENSITIES_T as a single float64 matrix.
+        """
+        if not ITR.HAS_UNCERTAINTIES or all(dtype.kind != "O" for dtype in intensities_t.dtypes):
+            return intensities_t.to_numpy(dtype=np.float64, na_value=np.nan)
+        # Float64 NA needs to be converted to np.nan before we can apply nominal_values
+        return np.asarray(
+            ITR.nominal_values(intensities_t.astype(object).fillna(np.nan).to_numpy()),
+            dtype=np.float64,
+        )
 
     def _get_trends(self, intensities_t: pd.DataFrame):
-        # FIXME: rolling windows require conversion to float64.  Don't want to be a nuisance...
-        intensities_t = intensities_t.apply(
-            lambda col: (
-                col
-                if col.dtype == np.float64
-                # Float64 NA needs to be converted to np.nan before we can apply nominal_values
-                else ITR.nominal_values(col.fillna(np.nan)).astype(np.float64)
-            )
-        )
-        # FIXME: Pandas 2.1
-        # Treat NaN ratios as "unchnaged year on year"
-        # FIXME Could we ever have UFloat NaNs here?  np.nan is valid UFloat.
-        ratios_t: pd.DataFrame = intensities_t.rolling(window=2, closed="right").apply(
-            func=self._year_on_year_ratio, raw=True
-        )
-        ratios_t = ratios_t.apply(lambda col: col.fillna(0) if all(col.map(lambda x: ITR.isna(x))) else col)
+        # Trends are computed on nominal values as a single (years x series) float64 matrix.  Rolling windows
+        # with a Python callback per window are far too slow when projecting many thousands of series.
+        ratios = self._year_on_year_ratios(self._nominal_values_matrix(intensities_t))
+        # Treat NaN ratios as "unchanged year on year" when a series has no ratios at all
+        ratios[:, np.isnan(ratios).all(axis=0)] = 0.0
+        ratios_t = pd.DataFrame(ratios, index=intensities_t.index, columns=intensities_t.columns)
 
         # # Add weight to trend movements across multiple years (normalized to year-over-year, not over two years...)
         # # FIXME: we only want to do this for median, not mean.
@@ -1542,51 +2054,61 @@ class EITrajectoryProjector(EIProjector):
         historic_ei_t: pd.DataFrame,
     ) -> pd.DataFrame:
         historic_ei_t = historic_ei_t[historic_ei_t.columns.intersection(trends_t.index)]
-        # We need to do a mini-extrapolation if we don't have complete historic data
-
-        def _extrapolate_mini(col, trend):
-            from pandas.api.types import is_numeric_dtype
-
-            # Inside these functions, columns are numeric PintArrays, not quantity-based Series
-            col_na = col.isna()
-            col_na_idx = col_na[col_na].index
-            last_valid = col[~col_na].tail(1).squeeze()
-            if np.isnan(trend):
-                # If there's no visible trend, just assume it doesn't decrease and copy results forward
-                col.loc[col_na_idx] = last_valid
-            else:
-                mini_trend = pd.Series([trend + 1] * len(col_na[col_na]), index=col_na_idx, dtype="float64").cumprod()
-                col.loc[col_na_idx] = last_valid * mini_trend
-            if col.dtype != np.float64 and is_numeric_dtype(col.dtype):
-                # FIXME: Pandas 2.1 we prefer NaNs to NA in Arrays for now
-                return col.astype(np.float64)
-            return col
+        growth = trends_t.reindex(historic_ei_t.columns).to_numpy(dtype=np.float64) + 1.0
+        nan_mask = np.isnan(self._nominal_values_matrix(historic_ei_t))
+        if all(dtype.kind != "O" for dtype in historic_ei_t.dtypes):
+            # FIXME: Pandas 2.1 we prefer NaNs to NA in Arrays for now
+            historic_ei = historic_ei_t.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            historic_ei = historic_ei_t.astype(object).fillna(np.nan).to_numpy()
+        n_historic, n_projected = historic_ei.shape[0], len(projection_years[1:])
+        columns = np.arange(historic_ei.shape[1])
+        last_valid_pos = n_historic - 1 - np.argmax(~nan_mask[::-1], axis=0)
+        last_valid = np.where(nan_mask.all(axis=0), np.nan, historic_ei[last_valid_pos, columns])
 
-        historic_ei_t = historic_ei_t.apply(lambda col: _extrapolate_mini(col, trends_t[col.name]))
+        # Historic and projected values share a single output buffer
+        extrapolated = np.empty((n_historic + n_projected, historic_ei.shape[1]), dtype=historic_ei.dtype)
+
+        # We need to do a mini-extrapolation if we don't have complete historic data: the k-th missing value
+        # becomes last_valid * (1+trend)**k.  If there's no visible trend, just assume it doesn't decrease and
+        # copy results forward.
+        mini_growth = np.cumprod(np.where(nan_mask, np.where(np.isnan(growth), 1.0, growth), 1.0), axis=0)
+        extrapolated[:n_historic] = np.where(nan_mask, last_valid * mini_growth, historic_ei)
 
         # Now the big extrapolation
-        projected_ei_t = (
-            pd.concat([trends_t.add(1.0)] * len(projection_years[1:]), axis=1)
-            .T.cumprod()
-            .rename(index=dict(zip(range(0, len(projection_years[1:])), projection_years[1:])))
-            .mul(historic_ei_t.iloc[-1], axis=1)
-        )
+        np.cumprod(np.broadcast_to(growth, (n_projected, len(growth))), axis=0, out=extrapolated[n_historic:])
+        extrapolated[n_historic:] *= extrapolated[n_historic - 1]
 
-        # Clean up rows by converting NaN/None into Quantity(np.nan, unit_type)
-        columnwise_ei_t = pd.concat([historic_ei_t, projected_ei_t])
-        columnwise_ei_t.index.name = "year"
+        columnwise_ei_t = pd.DataFrame(
+            extrapolated,
+            index=pd.Index(historic_ei_t.index.tolist() + list(projection_years[1:]), name="year"),
+            columns=historic_ei_t.columns,
+        )
+        if extrapolated.dtype == object:
+            # Series without uncertainties remain float64
+            columnwise_ei_t = columnwise_ei_t.astype(
+                {col: np.float64 for col, dtype in historic_ei_t.dtypes.items() if dtype.kind != "O"}
+            )
         return columnwise_ei_t
 
-    # Might return a float, might return a ufloat
-    def _year_on_year_ratio(self, arr: np.ndarray):
-        # Subsequent zeroes represent no year-on-year change
-        if arr[0] == 0.0 and arr[-1] == 0.0:
-            return 0.0
+    def _year_on_year_ratios(self, intensities: np.ndarray) -> np.ndarray:
+        """
+        Compute year-on-year ratios for every column of a (years x series) float64 matrix.
+
+        :param intensities: float64 matrix of intensities, one row per year and one column per series
+        :return: matrix of the same shape; the first row (and any ratio involving a NaN) is NaN
+        """
+        ratios = np.full(intensities.shape, np.nan, dtype=np.float64)
+        prev, curr = intensities[:-1], intensities[1:]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            yoy = curr / prev - 1.0
         # Due to rounding, we might overshoot the zero target and go negative
         # So round the negative number to zero and treat it as a 100% year-on-year decline
-        if arr[0] >= 0.0 and arr[-1] <= 0.0:
-            return -1.0
-        return (arr[-1] / arr[0]) - 1.0
+        yoy = np.where((prev >= 0.0) & (curr <= 0.0), -1.0, yoy)
+        # Subsequent zeroes represent no year-on-year change
+        yoy = np.where((prev == 0.0) & (curr == 0.0), 0.0, yoy)
+        ratios[1:] = yoy
+        return ratios
 
 
 class EITargetProjector(EIProjector):
@@ -0,0 +1,141 @@
+"""
+This module reads and writes compiled benchmark bundles, a fast-loading form of the benchmark JSON files.
+
+A bundle is an .npz file of benchmark arrays plus a .json metadata sidecar recording the digest of the JSON file
+it was compiled from.  The JSON file remains the source of truth: a bundle whose recorded digest (or format, or
+any other expected metadata) does not match is stale, and is recompiled by the loader that finds it so.
+
+Bundles are compiled into a per-user cache directory (so that read-only installations can still use them), which
+can be changed by setting the ITR_BUNDLE_DIR environment variable.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import IO, Any, Callable, Dict, Optional, Set, Tuple
+
+import numpy as np
+
+from ..configs import LoggingConfig
+
+logger = logging.getLogger(__name__)
+LoggingConfig.add_config_to_logger(logger)
+
+BUNDLE_FORMAT_VERSION = 1
+# Bundle directories we have already warned about being unwritable
+_unwritable_bundle_dirs: Set[str] = set()
+
+
+def source_digest(json_path: str) -> str:
+    """
+    :param json_path: path to a benchmark JSON file
+    :return: the SHA-256 hex digest of the file's contents
+    """
+    with open(json_path, "rb") as json_file:
+        return hashlib.sha256(json_file.read()).hexdigest()
+
+
+def default_bundle_dir(json_path: str) -> str:
+    """
+    :param json_path: path to a benchmark JSON file
+    :return: the directory of the user's bundle cache (ITR_BUNDLE_DIR, or ITR/bundles in XDG_CACHE_HOME) in which
+        bundles of JSON files in the directory of JSON_PATH are compiled
+    """
+    cache_dir = os.environ.get("ITR_BUNDLE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache")), "ITR", "bundles"
+    )
+    # Keep bundles of JSON files with the same name (in different directories) apart
+    source_dir = os.path.dirname(os.path.abspath(json_path))
+    return os.path.join(cache_dir, hashlib.sha256(source_dir.encode()).hexdigest()[:16])
+
+
+def bundle_paths(json_path: str, bundle_dir: Optional[str] = None) -> Tuple[str, str]:
+    """
+    :param json_path: path to a benchmark JSON file
+    :param bundle_dir: directory holding compiled bundles; defaults to `default_bundle_dir(json_path)`
+    :return: the paths of the bundle's arrays (.npz) and metadata (.json) files
+    """
+    if bundle_dir is None:
+        bundle_dir = default_bundle_dir(json_path)
+    stem = os.path.join(bundle_dir, os.path.splitext(os.path.basename(json_path))[0])
+    return f"{stem}.npz", f"{stem}.json"
+
+
+def read_bundle(
+    json_path: str, bundle_dir: Optional[str] = None, **expected_metadata: Any
+) -> Optional[Tuple[Dict[str, np.ndarray], Dict[str, Any]]]:
+    """
+    Read the compiled bundle of JSON_PATH if it is up to date.
+
+    :param json_path: path to a benchmark JSON file
+    :param bundle_dir: directory holding compiled bundles
+    :param expected_metadata: further metadata values (such as the projection years) the bundle must have been compiled with
+    :return: the bundle's arrays and metadata, or None if there is no up-to-date bundle
+    """
+    npz_path, metadata_path = bundle_paths(json_path, bundle_dir)
+    try:
+        with open(metadata_path) as metadata_file:
+            metadata = json.load(metadata_file)
+    except (OSError, ValueError):
+        return None
+    expected_metadata = dict(expected_metadata, format=BUNDLE_FORMAT_VERSION, source_sha256=source_digest(json_path))
+    if any(metadata.get(k) != v for k, v in expected_metadata.items()):
+        logger.info(f"Benchmark bundle {npz_path} is out of date with {json_path}")
+        return None
+    try:
+        with np.load(npz_path, allow_pickle=False) as npz:
+            arrays = {k: npz[k] for k in npz.files}
+    except (OSError, ValueError):
+        return None
+    return arrays, metadata
+
+
+def _replace_file(path: str, mode: str, write: Callable[[IO], Any]) -> None:
+    """
+    Atomically replace the file at PATH with what WRITE writes to a file opened with MODE.  The temporary file is
+    unique, so concurrent writers of the same bundle never write into each other's files.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as tmp_file:
+            write(tmp_file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_bundle(
+    json_path: str, arrays: Dict[str, np.ndarray], metadata: Dict[str, Any], bundle_dir: Optional[str] = None
+) -> bool:
+    """
+    Compile ARRAYS and METADATA into the bundle of JSON_PATH.  Failure to write (a read-only cache directory, say)
+    is not an error: the benchmark simply continues to load from JSON, and we warn only once per directory.
+
+    :param json_path: path to the benchmark JSON file the bundle is compiled from
+    :param arrays: the benchmark arrays
+    :param metadata: JSON-serializable metadata needed to rebuild the benchmark from ARRAYS
+    :param bundle_dir: directory holding compiled bundles
+    :return: True if the bundle was written
+    """
+    npz_path, metadata_path = bundle_paths(json_path, bundle_dir)
+    metadata = dict(metadata, format=BUNDLE_FORMAT_VERSION, source_sha256=source_digest(json_path))
+    try:
+        os.makedirs(os.path.dirname(npz_path), exist_ok=True)
+        # The metadata file is written last (and atomically) so that it only ever describes a complete .npz file
+        _replace_file(npz_path, "wb", lambda npz_file: np.savez(npz_file, **arrays))
+        _replace_file(metadata_path, "w", lambda metadata_file: json.dump(metadata, metadata_file))
+    except (OSError, TypeError, ValueError) as err:
+        bundle_dir = os.path.dirname(npz_path)
+        if bundle_dir in _unwritable_bundle_dirs:
+            logger.debug(f"Could not compile benchmark bundle for {json_path}: {err}")
+        else:
+            _unwritable_bundle_dirs.add(bundle_dir)
+            logger.warning(f"Could not compile benchmark bundle for {json_path} (in {bundle_dir}): {err}")
+        return False
+    return True
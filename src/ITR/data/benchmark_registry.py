@@ -0,0 +1,172 @@
+"""
+This module provides a registry of benchmarks that are loaded on first use and shared by every DataWarehouse
+that asks for them.
+
+Benchmarks are found by file name in a directory of benchmark JSON files (by default the benchmarks shipped in
+ITR.data_dir): benchmark_production_<name>.json for production benchmarks, benchmark_EI_<name>.json for emissions
+intensity benchmarks.  At most max_resident benchmarks are kept by the registry; the least recently used is
+dropped first.  A dropped benchmark lives on for as long as some warehouse still holds it, and is simply
+reloaded (quickly, from its compiled bundle) when next asked for.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union, cast
+
+from .. import data_dir
+from ..configs import ColumnsConfig, LoggingConfig, ProjectionControls
+from ..data.base_providers import BaseProviderIntensityBenchmark, BaseProviderProductionBenchmark
+from ..data.data_providers import IntensityBenchmarkDataProvider, ProductionBenchmarkDataProvider
+
+logger = logging.getLogger(__name__)
+LoggingConfig.add_config_to_logger(logger)
+
+PRODUCTION_BENCHMARK_PREFIX = "benchmark_production_"
+EI_BENCHMARK_PREFIX = "benchmark_EI_"
+
+BenchmarkDataProvider = Union[ProductionBenchmarkDataProvider, IntensityBenchmarkDataProvider]
+# (prefix, name, projection years) of a loaded benchmark
+BenchmarkKey = Tuple[str, str, Tuple[int, ...]]
+
+
+class BenchmarkRegistry:
+    def __init__(
+        self,
+        benchmark_dir: Optional[str] = None,
+        max_resident: int = 4,
+        column_config: Type[ColumnsConfig] = ColumnsConfig,
+        projection_controls: ProjectionControls = ProjectionControls(),
+        bundle_dir: Optional[str] = None,
+    ):
+        """
+        Registry of lazily-loaded benchmarks.  The benchmarks it returns are shared, and so must be treated as
+        immutable: to vary a benchmark parameter (such as its temperature), load a separate instance.
+        :param benchmark_dir: directory of benchmark JSON files; defaults to ITR.data_dir
+        :param max_resident: the maximum number of benchmarks kept loaded by the registry
+        :param column_config: An optional ColumnsConfig object containing relevant variable names
+        :param projection_controls: Projection Controls set the default BASE_YEAR and TARGET_YEAR of intensity
+        benchmarks
+        :param bundle_dir: directory holding compiled bundles (see ITR.data.benchmark_bundle)
+        """
+        if max_resident < 1:
+            raise ValueError(f"max_resident must be at least 1, not {max_resident}")
+        self.benchmark_dir = data_dir if benchmark_dir is None else benchmark_dir
+        self.max_resident = max_resident
+        self.column_config = column_config
+        self.projection_controls = projection_controls
+        self.bundle_dir = bundle_dir
+        # Most recently used last
+        self._resident: "OrderedDict[BenchmarkKey, BenchmarkDataProvider]" = OrderedDict()
+        # Benchmarks being loaded, so that concurrent first uses of a benchmark share a single load
+        self._loading: Dict[BenchmarkKey, "Future[BenchmarkDataProvider]"] = {}
+        # Guards only _resident and _loading; benchmarks are loaded without holding it
+        self._lock = threading.Lock()
+
+    def _available(self, prefix: str) -> List[str]:
+        return sorted(
+            filename[len(prefix) : -len(".json")]  # noqa: E203
+            for filename in os.listdir(self.benchmark_dir)
+            if filename.startswith(prefix) and filename.endswith(".json")
+        )
+
+    def available_production_benchmarks(self) -> List[str]:
+        """
+        :return: the names of the production benchmarks in the benchmark directory
+        """
+        return self._available(PRODUCTION_BENCHMARK_PREFIX)
+
+    def available_intensity_benchmarks(self) -> List[str]:
+        """
+        :return: the names of the emissions intensity benchmarks in the benchmark directory
+        """
+        return self._available(EI_BENCHMARK_PREFIX)
+
+    def resident_benchmarks(self) -> List[str]:
+        """
+        :return: the file names (least recently used first) of the benchmarks currently loaded by the registry
+        """
+        with self._lock:
+            return [f"{prefix}{name}.json" for prefix, name, _ in self._resident]
+
+    def _get(self, key: BenchmarkKey, load: Callable[[str], BenchmarkDataProvider]) -> BenchmarkDataProvider:
+        prefix, name, _ = key
+        with self._lock:
+            benchmark = self._resident.get(key)
+            if benchmark is not None:
+                self._resident.move_to_end(key)
+                return benchmark
+            loading = self._loading.get(key)
+            if loading is None:
+                future: "Future[BenchmarkDataProvider]" = Future()
+                self._loading[key] = future
+        if loading is not None:
+            # Another thread is loading this benchmark; share its result (or its exception)
+            return loading.result()
+
+        try:
+            json_path = os.path.join(self.benchmark_dir, f"{prefix}{name}.json")
+            if not os.path.isfile(json_path):
+                raise ValueError(
+                    f"benchmark {name} not found (available: {', '.join(self._available(prefix))}) in {self.benchmark_dir}"
+                )
+            logger.info(f"Loading benchmark {json_path}")
+            benchmark = load(json_path)
+        except BaseException as exc:
+            with self._lock:
+                del self._loading[key]
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            del self._loading[key]
+            self._resident[key] = benchmark
+            while len(self._resident) > self.max_resident:
+                (evicted_prefix, evicted_name, _), _ = self._resident.popitem(last=False)
+                logger.info(f"Dropping least recently used benchmark {evicted_prefix}{evicted_name}.json")
+        future.set_result(benchmark)
+        return benchmark
+
+    def get_production_benchmark(self, name: str = "OECM") -> ProductionBenchmarkDataProvider:
+        """
+        :param name: the production benchmark name, as in benchmark_production_<name>.json
+        :return: the (shared) production benchmark, loaded if not already resident
+        """
+        return cast(
+            ProductionBenchmarkDataProvider,
+            self._get(
+                (PRODUCTION_BENCHMARK_PREFIX, name, ()),
+                lambda json_path: BaseProviderProductionBenchmark.from_json(
+                    json_path, self.column_config, self.bundle_dir
+                ),
+            ),
+        )
+
+    def get_intensity_benchmark(
+        self, name: str, projection_controls: Optional[ProjectionControls] = None
+    ) -> IntensityBenchmarkDataProvider:
+        """
+        :param name: the emissions intensity benchmark name, as in benchmark_EI_<name>.json (such as OECM_S3)
+        :param projection_controls: Projection Controls setting the BASE_YEAR and TARGET_YEAR of the benchmark;
+        defaults to those of the registry.  Benchmarks projected over different years are separate instances.
+        :return: the (shared) emissions intensity benchmark, loaded if not already resident
+        """
+        if projection_controls is None:
+            projection_controls = self.projection_controls
+        return cast(
+            IntensityBenchmarkDataProvider,
+            self._get(
+                (EI_BENCHMARK_PREFIX, name, (projection_controls.BASE_YEAR, projection_controls.TARGET_YEAR)),
+                lambda json_path: BaseProviderIntensityBenchmark.from_json(
+                    json_path, self.column_config, projection_controls, self.bundle_dir
+                ),
+            ),
+        )
+
+    def clear(self):
+        """
+        Drop all resident benchmarks
+        """
+        with self._lock:
+            self._resident.clear()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from abc import ABC, abstractmethod
 from typing import List, Optional, Type
 
@@ -167,6 +168,7 @@ class ProductionBenchmarkDataProvider(ABC):
         :param config: A dictionary containing the configuration parameters for this data provider.
         """
         self._own_data = False
+        self._fingerprint = ""
 
     @property
     def own_data(self) -> bool:
@@ -175,6 +177,13 @@ class ProductionBenchmarkDataProvider(ABC):
         """
         return self._own_data
 
+    @property
+    def fingerprint(self) -> str:
+        """
+        :return: a stable digest of the benchmark content, used to detect benchmark changes and to key caches
+        """
+        return self._fingerprint
+
     @abstractmethod
     def benchmark_changed(self, production_benchmark: ProductionBenchmarkDataProvider) -> bool:
         raise NotImplementedError
@@ -216,6 +225,7 @@ class IntensityBenchmarkDataProvider(ABC):
         self._is_AFOLU_included = is_AFOLU_included
         self._benchmark_global_budget = benchmark_global_budget
         self._own_data = False
+        self._fingerprint = ""
 
     @property
     def own_data(self) -> bool:
@@ -224,6 +234,23 @@ class IntensityBenchmarkDataProvider(ABC):
         """
         return self._own_data
 
+    @property
+    def fingerprint(self) -> str:
+        """
+        :return: a stable digest of the benchmark content and parameters, used to detect benchmark changes and to key caches
+        """
+        # Benchmark parameters can be changed after construction, so they are folded into the content digest here
+        return hashlib.sha256(
+            repr(
+                (
+                    self._fingerprint,
+                    self._benchmark_temperature,
+                    self._benchmark_global_budget,
+                    self._is_AFOLU_included,
+                )
+            ).encode()
+        ).hexdigest()
+
     @abstractmethod
     def get_scopes(self) -> List[EScope]:
         raise NotImplementedError
@@ -1,4 +1,5 @@
 import logging
+import sys
 import warnings  # needed until apply behaves better with Pint quantities in arrays
 from abc import ABC
 from typing import Any, Callable, Dict, List, Optional
@@ -6,12 +7,13 @@ from typing import Any, Callable, Dict, List, Optional
 import numpy as np
 import pandas as pd
 from pint import DimensionalityError
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 import ITR
 
-from ..configs import ColumnsConfig, LoggingConfig
+from ..configs import ColumnsConfig, LoggingConfig, ProjectionControls
 from ..data import PA_, Q_
+from ..data.base_providers import EITrajectoryProjector
 from ..data.data_providers import (
     CompanyDataProvider,
     IntensityBenchmarkDataProvider,
@@ -387,6 +389,58 @@ class DataWarehouse(ABC):
             company.projected_intensities = None
         self.company_data._validate_projected_trajectories(self.company_data._companies, self.benchmarks_projected_ei)
 
+    def get_trajectory_variants(self, variants: List[ProjectionControls]) -> pd.DataFrame:
+        """
+        Compute the trajectories of all companies with historic data under each of the ProjectionControls in
+        VARIANTS, sharing a single extraction of historic data.  The trajectories held by the DataWarehouse are
+        not changed.  See `EITrajectoryProjector.project_ei_trajectory_variants` for the layout of the result.
+        Without an EI benchmark, trajectories are projected just as they are before benchmarks are set.
+        """
+        companies = [company for company in self.company_data._companies if not company.historic_data.empty]
+        ei_df_t = None
+        if self.benchmarks_projected_ei is not None:
+            ei_df_t = self.benchmarks_projected_ei._get_intensity_benchmarks()
+        projector = EITrajectoryProjector(self.company_data.projection_controls, ei_df_t)
+        return projector.project_ei_trajectory_variants(companies, variants)
+
+    def memory_report(self, sample_size: Optional[int] = None) -> Dict[str, int]:
+        """
+        Report the approximate resident size (in bytes, as measured by ITR.utils.get_size) of the data held by this
+        DataWarehouse.  Each object is counted once, in the first category that reaches it (in the order below).
+        The data is measured on every call, so the report is never stale; use SAMPLE_SIZE to keep it cheap.
+
+        :param sample_size: If given, measure only this many (evenly spaced) companies and scale their sizes up to
+        the whole company store.  This makes the report fast for large company stores, at the cost of accuracy.
+        :return: A dictionary of sizes for historic_data, projected_intensities, projected_targets (all summed
+        over companies), orig_historic_data, company_store (the remaining company data), benchmarks (the frames,
+        arrays and models of the production and EI benchmarks), and their total
+        """
+        from ..utils import get_size
+
+        companies = getattr(self.company_data, "_companies", [])
+        if sample_size is not None and 0 < sample_size < len(companies):
+            sample = [companies[i] for i in np.unique(np.linspace(0, len(companies) - 1, sample_size).astype(int))]
+        else:
+            sample = companies
+        scale = len(companies) / len(sample) if sample else 1.0
+        seen = {id(companies)}
+        report = {}
+        for attr in ["historic_data", "projected_intensities", "projected_targets"]:
+            report[attr] = round(scale * sum(get_size(getattr(c, attr), seen) for c in sample))
+        report["orig_historic_data"] = sys.getsizeof(self.orig_historic_data) + round(
+            scale * sum(get_size(self.orig_historic_data.get(c.company_id), seen) for c in sample)
+        )
+        report["company_store"] = sys.getsizeof(companies) + round(scale * sum(get_size(c, seen) for c in sample))
+        report["benchmarks"] = sum(
+            get_size(v, seen)
+            for benchmark in [self.benchmark_projected_production, self.benchmarks_projected_ei]
+            if benchmark is not None
+            for v in vars(benchmark).values()
+            if isinstance(v, (pd.DataFrame, pd.Series, np.ndarray, BaseModel))
+        )
+        report["total"] = sum(report.values())
+        return report
+
     def estimate_missing_s3_data(self, company: ICompanyData):
         # We need benchmark data to estimate S3 from projected_intensities (which go back in time to BASE_YEAR).
         # We don't need to estimate further back than that, as we don't rewrite values stored in historic_data.
@@ -585,16 +639,14 @@ class DataWarehouse(ABC):
         df_company_data[ColumnsConfig.BENCHMARK_TEMP] = [str(benchmark_temperature)] * len(df_company_data)
         return df_company_data
 
-    def get_preprocessed_company_data(self, company_ids: List[str]) -> List[ICompanyAggregates]:
+    def _preprocess_company_data(self, company_data: List[ICompanyData]) -> pd.DataFrame:
         """
-        Get all relevant data for a list of company ids. This method should return a list of ICompanyAggregates
-        instances.
+        Compute the benchmark-derived aggregates of COMPANY_DATA for each of its scopes.
 
-        :param company_ids: A list of company IDs (ISINs)
-        :return: A list containing the company data and additional precalculated fields
+        :param company_data: A list of ICompanyData
+        :return: A DataFrame indexed by company_id with one row per company and scope, holding the company data
+        and the additional precalculated fields
         """
-
-        company_data = self.company_data.get_company_data(company_ids)
         df_company_data = pd.DataFrame.from_records([dict(c) for c in company_data]).set_index(
             self.company_data.column_config.COMPANY_ID, drop=False
         )
@@ -628,6 +680,40 @@ class DataWarehouse(ABC):
             benchmark_temperature=self.benchmarks_projected_ei.benchmark_temperature,
             global_budget=self.benchmarks_projected_ei.benchmark_global_budget,
         )
+        return df_company_data
+
+    def get_preprocessed_company_frame(self, company_ids: List[str]) -> pd.DataFrame:
+        """
+        Get all relevant data for a list of company ids as a DataFrame, without building the ICompanyAggregates
+        instances of `get_preprocessed_company_data`.  This is what `ITR.utils.get_data` reads.  If a subclass
+        overrides `get_preprocessed_company_data` (but not this method), the frame is built from the
+        ICompanyAggregates it supplies.
+
+        :param company_ids: A list of company IDs (ISINs)
+        :return: A DataFrame indexed by company_id with one row per company and scope, whose columns are the
+        fields of ICompanyAggregates
+        """
+        # Whichever of the two methods is defined by the most derived class (or mixin) in the MRO wins
+        mro_position = {
+            name: next(i for i, cls in enumerate(type(self).__mro__) if name in vars(cls))
+            for name in ["get_preprocessed_company_data", "get_preprocessed_company_frame"]
+        }
+        if mro_position["get_preprocessed_company_data"] < mro_position["get_preprocessed_company_frame"]:
+            return self._convert_model_to_df(self.get_preprocessed_company_data(company_ids))
+        df_company_data = self._preprocess_company_data(self.company_data.get_company_data(company_ids))
+        return df_company_data[list(ICompanyAggregates.model_fields)]
+
+    def get_preprocessed_company_data(self, company_ids: List[str]) -> List[ICompanyAggregates]:
+        """
+        Get all relevant data for a list of company ids. This method should return a list of ICompanyAggregates
+        instances.
+
+        :param company_ids: A list of company IDs (ISINs)
+        :return: A list containing the company data and additional precalculated fields
+        """
+
+        company_data = self.company_data.get_company_data(company_ids)
+        df_company_data = self._preprocess_company_data(company_data)
 
         # This was WICKED SLOW: aggregate_company_data = [ICompanyAggregates.parse_obj(company) for company in companies]
         aggregate_company_data = [
@@ -672,6 +758,18 @@ class DataWarehouse(ABC):
                 pass
         return model_companies
 
+    @staticmethod
+    def _convert_model_to_df(model_companies: List[ICompanyAggregates]) -> pd.DataFrame:
+        """
+        transforms a list of ICompanyAggregates instances into the DataFrame of `get_preprocessed_company_frame`
+
+        :param model_companies: A list of ICompanyAggregates
+        :return: A DataFrame indexed by company_id whose columns are the fields of ICompanyAggregates
+        """
+        return pd.DataFrame.from_records(
+            [dict(c) for c in model_companies], columns=list(ICompanyAggregates.model_fields)
+        ).set_index(ColumnsConfig.COMPANY_ID, drop=False)
+
     @classmethod
     def _get_cumulative_emissions(cls, projected_ei: pd.DataFrame, projected_production: pd.DataFrame) -> pd.DataFrame:
         """
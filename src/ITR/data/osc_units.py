@@ -3,8 +3,11 @@ This module handles initialization of pint functionality
 """
 
 import re
-from typing import Annotated, Any, List, Union
+from functools import lru_cache
+from operator import attrgetter
+from typing import Annotated, Any, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import pint
 from pint import Context, DimensionalityError
@@ -20,6 +23,21 @@ from ..data import PA_, Q_, PintType, ureg
 
 Quantity: TypeAlias = ureg.Quantity
 
+
+def enable_contexts(*names: str) -> None:
+    """
+    Enable the contexts NAMES without loading the GWP metric contexts of openscm_units.
+
+    openscm_units overloads `enable_contexts` to add roughly a thousand GWP contexts the first time any context
+    is enabled.  ITR never enables those contexts, and building them is the single largest cost of importing ITR.
+    Going straight to Pint's own `enable_contexts` leaves them to be added (by openscm_units) the first time
+    somebody enables a context through the registry itself, such as with `ureg.context(...)`.
+
+    :param names: The names of contexts already added to the registry
+    """
+    super(type(ureg), ureg).enable_contexts(*names)
+
+
 ureg.define("CO2e = CO2 = CO2eq = CO2_eq")
 # openscm_units does this for all gas species...we just have to keep up.
 ureg.define("tCO2e = t CO2e")
@@ -135,7 +153,7 @@ coal.add_transformation("[energy]", "[mass] Coal", lambda ureg, x: x / COAL_SE)
 coal.add_transformation("g Coal", "g CO2e", lambda ureg, x: x * ureg("1.992 g CO2e / (1 g Coal)"))
 ureg.add_context(coal)
 
-ureg.enable_contexts("ngas", "coal")
+enable_contexts("ngas", "coal")
 
 
 # from https://github.com/hgrecco/pint/discussions/1697
@@ -164,6 +182,58 @@ def direct_conversions(ureg, unit) -> List[str]:
 # {name: getattr(ureg, name).dimensionality for name in conversions}
 
 
+# Parsed units and conversion factors are memoized (at most UNITS_CACHE_SIZE of each).  Conversion factors are keyed
+# by the state of the active contexts, so that redefining a unit in a context (as each template with FX quotes does
+# to the FX context) can never serve a factor computed under the old definition.
+UNITS_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=UNITS_CACHE_SIZE)
+def _parse_units(units: str) -> pint.Unit:
+    return ureg.parse_units(units)
+
+
+def parse_units(units: Union[str, pint.Unit]) -> pint.Unit:
+    """
+    A memoized `ureg.parse_units`.
+    """
+    if isinstance(units, pint.Unit):
+        return units
+    return _parse_units(units)
+
+
+def _active_contexts_key() -> Tuple[Tuple[int, int, int], ...]:
+    # Cheaper than ureg._active_ctx.hashable(): contexts only ever grow their transformations and redefinitions
+    return tuple((id(ctx), len(ctx.funcs), len(ctx.redefinitions)) for ctx in ureg._active_ctx.contexts)
+
+
+@lru_cache(maxsize=UNITS_CACHE_SIZE)
+def _conversion_factor(src_units: pint.Unit, dst_units: pint.Unit, contexts_key: Tuple) -> float:
+    one = Q_(1.0, src_units)
+    for units, quantity in [(src_units, one), (dst_units, Q_(1.0, dst_units))]:
+        if not quantity._is_multiplicative:
+            raise ValueError(f"{units} is an offset unit, which has no conversion factor")
+    return one.to(dst_units).m
+
+
+def conversion_factor(src_units: Union[str, pint.Unit], dst_units: Union[str, pint.Unit]) -> float:
+    """
+    The factor by which magnitudes in SRC_UNITS are multiplied to give magnitudes in DST_UNITS (using the active
+    contexts).  Raises DimensionalityError if the units are not compatible, or ValueError for offset units
+    (such as degC) which cannot be converted by a factor.
+    """
+    return _conversion_factor(parse_units(src_units), parse_units(dst_units), _active_contexts_key())
+
+
+def clear_units_cache():
+    """
+    Drop all memoized units and conversion factors, such as after redefining units in the registry itself.
+    """
+    _parse_units.cache_clear()
+    _conversion_factor.cache_clear()
+    _production_alignment.cache_clear()
+
+
 def time_dimension(unit, exp) -> bool:
     """
     True if UNIT can be converted to something related only to time.
@@ -226,6 +296,34 @@ def dimension_as(x, dim_unit):
         raise DimensionalityError(x, dim_unit, extra_msg="; no compatible dimension not found")
 
 
+@lru_cache(maxsize=UNITS_CACHE_SIZE)
+def _production_alignment(
+    production_units: pint.Unit, ei_units: pint.Unit, contexts_key: Tuple
+) -> Tuple[Optional[PintType], float]:
+    # The entry of the production/EI alignment table for PRODUCTION_UNITS and EI_UNITS: the dtype into which production
+    # is converted and the factor that converts it, or (None, nan) if the units cannot be aligned
+    ei_unit_top, ei_unit_bottom = str(ei_units).split("/", 1)
+    if "/" in ei_unit_bottom:
+        # Fix reciprocals: t CO2e / CH4 / bcm -> t CO2e / (CH4 * bcm)
+        (bottom_unit_num, bottom_unit_denom) = ei_unit_bottom.split("/", 1)
+        ei_unit_bottom = f"{bottom_unit_num} {bottom_unit_denom}"
+    # We might need to add mass dimension back in if it was simplified out (t CO2e / t Fe, for example)
+    if "[mass]" not in parse_units(ei_unit_top).dimensionality:
+        mass_units = [
+            unit
+            for unit, exp in pint.util.to_units_container(Q_(1.0, production_units).to_base_units()).items()
+            if exp == 1 and ureg(unit).is_compatible_with("kg")
+        ]
+        if not mass_units:
+            # If no mass term in production, likely a dimensional mismatch between production and ei_unit_bottom
+            return None, np.nan
+        ei_unit_bottom = f"{mass_units[0]} {ei_unit_bottom}"
+    try:
+        return PintType(ei_unit_bottom), conversion_factor(production_units, ei_unit_bottom)
+    except DimensionalityError:
+        return None, np.nan
+
+
 def align_production_to_bm(prod_series: pd.Series, ei_bm: pd.Series) -> pd.Series:
     """
     A timeseries of production unit values can be aligned with a timeseries of Emissions Intensity (EI)
@@ -235,35 +333,27 @@ def align_production_to_bm(prod_series: pd.Series, ei_bm: pd.Series) -> pd.Serie
     needed later (such as trying to convert `t CO2e * metric_ton / bbl` to
     `CO2e * metric_ton / gigajoule`, which is not straightfowrard, as the former is
     `[mass] / [length]**3` whereas the latter is `[seconds] ** 2 / [length] **2`.
+
+    How each pair of production and EI units aligns is worked out once (for the active contexts) and kept in a
+    table, so aligning a series is a lookup and a multiplication.
     """
-    if ureg(f"t CO2e/({prod_series.iloc[0].units})") == ei_bm.iloc[0]:
-        return prod_series
-    # Convert the units of production into the denominator of the EI units
-    ei_units = str(ei_bm.iloc[0].units)
-    (ei_unit_top, ei_unit_bottom) = ei_units.split("/", 1)
-    if "/" in ei_unit_bottom:
-        # Fix reciprocals: t CO2e / CH4 / bcm -> t CO2e / (CH4 * bcm)
-        (bottom_unit_num, bottom_unit_denom) = ei_unit_bottom.split("/", 1)
-        ei_unit_bottom = f"{bottom_unit_num} {bottom_unit_denom}"
-    # We might need to add mass dimension back in if it was simplified out (t CO2e / t Fe, for example)
-    if "[mass]" not in ureg.parse_units(ei_unit_top).dimensionality:
-        try:
-            mass_unit = [
-                unit
-                for unit, exp in pint.util.to_units_container(prod_series.iloc[0].to_base_units()).items()
-                if exp == 1 and ureg(unit).is_compatible_with("kg")
-            ][0]
-            ei_unit_bottom = f"{mass_unit} {ei_unit_bottom}"
-        except IndexError:
-            # If no mass term in prod_series, likely a dimensional mismatch between prod_series and ei_unit_bottom
-            raise DimensionalityError(
-                prod_series.iloc[0],
-                "",
-                dim1=str(prod_series.dtype.units),
-                dim2=ei_unit_bottom,
-                extra_msg="cannot align units",
-            )
-    return asPintSeries(prod_series).pint.to(ei_unit_bottom)
+    if not isinstance(prod_series.dtype, PintType):
+        prod_series = asPintSeries(prod_series)
+    ei_units = ei_bm.dtype.units if isinstance(ei_bm.dtype, PintType) else ei_bm.iloc[0].units
+    aligned_dtype, factor = _production_alignment(prod_series.dtype.units, ei_units, _active_contexts_key())
+    if aligned_dtype is None:
+        raise DimensionalityError(
+            prod_series.iloc[0],
+            "",
+            dim1=str(prod_series.dtype.units),
+            dim2=str(ei_units),
+            extra_msg="cannot align units",
+        )
+    return pd.Series(
+        PA_(prod_series.values.numpy_data * factor, dtype=aligned_dtype),
+        index=prod_series.index,
+        name=prod_series.name,
+    )
 
 
 oil = Context("oil")
@@ -297,7 +387,7 @@ oil.add_transformation(
     lambda ureg, x: (x * ureg("boe/bbl")).to_reduced_units(),
 )
 ureg.add_context(oil)
-ureg.enable_contexts("oil")
+enable_contexts("oil")
 
 # Transportation activity
 
@@ -578,6 +668,36 @@ def Quantity_type(units: str) -> type:
     )
 
 
+def _homogeneous_pint_array(values: np.ndarray) -> Optional[pd.api.extensions.ExtensionArray]:
+    """
+    The fast path of asPintSeries: if every non-NA element of VALUES is a Quantity with a real magnitude, all in the
+    same units, return a PintArray built directly from a float64 buffer of their magnitudes (NA elements become
+    NaN).  Otherwise return None.
+    """
+    notna = ~pd.isna(values)
+    quantities = values[notna]
+    if len(quantities) == 0 or not isinstance(quantities[0], Quantity):
+        return None
+    try:
+        # Elements that are not Quantities have no _units (or, like Units, no _magnitude)
+        get_units = attrgetter("_units")
+        units_ids = np.fromiter(map(id, map(get_units, quantities)), dtype=np.int64, count=len(quantities))
+        # Quantities usually share their UnitsContainer, so only distinct containers need comparing
+        if len(pd.unique(units_ids)) > 1:
+            _, distinct = np.unique(units_ids, return_index=True)
+            if len({get_units(quantities[i]) for i in distinct}) > 1:
+                return None
+        # Magnitudes that are not real numbers (such as uncertainties) take the slow path
+        magnitudes = np.array(list(map(attrgetter("_magnitude"), quantities)), dtype=np.float64)
+    except (AttributeError, TypeError, ValueError):
+        return None
+    if len(quantities) < len(values):
+        all_magnitudes = np.full(len(values), np.nan)
+        all_magnitudes[notna] = magnitudes
+        magnitudes = all_magnitudes
+    return PA_(magnitudes, dtype=str(quantities[0].u))
+
+
 def asPintSeries(series: pd.Series, name=None, errors="ignore", inplace=False) -> pd.Series:
     """
     :param series : pd.Series possibly containing Quantity values, not already in a PintArray.
@@ -605,7 +725,10 @@ def asPintSeries(series: pd.Series, name=None, errors="ignore", inplace=False) -
             raise ValueError(f"Series '{series.name}' not dtype('O')")
         else:
             raise ValueError("Series not dtype('O')")
-    # NA_VALUEs are true NaNs, missing units
+    pint_array = _homogeneous_pint_array(series.to_numpy())
+    if pint_array is not None:
+        return pd.Series(pint_array, index=series.index, name=name if name else series.name)
+    # Mixed units (or magnitudes): NA_VALUEs are true NaNs, missing units
     na_values = ITR.isna(series)
     units = series[~na_values].map(lambda x: x.u if isinstance(x, Quantity) else None)  # type: ignore
     unit_first_idx = units.first_valid_index()
@@ -638,15 +761,15 @@ def asPintDataFrame(df: pd.DataFrame, errors="ignore", inplace=False) -> pd.Data
     Raises ValueError if there are more than one type of units in any of the columns.
     """
     if inplace:
-        new_df = df
-    else:
-        new_df = pd.DataFrame()
-    for col in df.columns:
-        new_df[col] = asPintSeries(df[col], name=col, errors=errors, inplace=inplace)
-    new_df.index = df.index
-    # When DF.COLUMNS is a MultiIndex, the naive column-by-column construction replaces MultiIndex values
-    # with the anonymous tuple of the MultiIndex and DF.COLUMNS becomes just an Index of tuples.
-    # We need to restore the MultiIndex or lose information.
+        for col in df.columns:
+            df[col] = asPintSeries(df[col], name=col, errors=errors, inplace=inplace)
+        return df
+    # Build the new DataFrame in one step from the converted columns (by position, in case column names repeat);
+    # a MultiIndex of columns is restored afterwards, as the dict keys cannot carry it.
+    new_df = pd.DataFrame(
+        {i: asPintSeries(df.iloc[:, i], name=col, errors=errors).array for i, col in enumerate(df.columns)},
+        index=df.index,
+    )
     new_df.columns = df.columns
     return new_df
 
@@ -27,6 +27,7 @@ from ..data.osc_units import (
     ProductionMetric,
     asPintDataFrame,
     asPintSeries,
+    enable_contexts,
     fx_ctx,
 )
 from ..interfaces import (
@@ -627,7 +628,7 @@ class TemplateProviderCompany(BaseCompanyDataProvider):
                     axis=1,
                 )
                 ureg.add_context(fx_ctx)
-                ureg.enable_contexts("FX")
+                enable_contexts("FX")
 
                 for col in fundamental_metrics:
                     # PintPandas 0.3 (without OS-Climate enhancements) cannot deal with Float64DTypes that contain pd.NA
@@ -18,7 +18,11 @@ from ..configs import ColumnsConfig, LoggingConfig, ProjectionControls
 from ..data import PintArray, PintType, ureg
 
 # Rather than duplicating a few methods from BaseCompanyDataProvider, we just call them to delegate to them
-from ..data.base_providers import BaseCompanyDataProvider
+from ..data.base_providers import (
+    BaseCompanyDataProvider,
+    benchmark_fingerprint,
+    get_benchmark_column_positions,
+)
 from ..data.data_providers import (
     IntensityBenchmarkDataProvider,
     ProductionBenchmarkDataProvider,
@@ -287,6 +291,7 @@ class VaultProviderProductionBenchmark(ProductionBenchmarkDataProvider):
             df = prod_df.stack(level=0).to_frame("production").reset_index()
             df.scope = df.scope.map(lambda x: x.name)
             create_vault_table_from_df(df, benchmark_name, self._v)
+        self._fingerprint = benchmark_fingerprint(self._prod_df)
 
     def benchmark_changed(self, new_projected_production: ProductionBenchmarkDataProvider) -> bool:
         # The Data Vault does not keep its own copies of benchmarks
@@ -406,14 +411,14 @@ class VaultProviderIntensityBenchmark(IntensityBenchmarkDataProvider):
             df["is_AFOLU_included"] = is_AFOLU_included
             df["production_centric"] = production_centric
             create_vault_table_from_df(df, benchmark_name, self._v)
+        self._fingerprint = benchmark_fingerprint(self._EI_df_t, self.production_centric)
 
     def get_scopes(self) -> List[EScope]:
         scopes = self._EI_df_t.columns.get_level_values("scope").unique()
         return scopes.tolist()
 
     def benchmarks_changed(self, new_projected_ei: IntensityBenchmarkDataProvider) -> bool:
-        assert hasattr(new_projected_ei, "_EI_df_t")
-        return self._EI_df_t.compare(new_projected_ei._EI_df_t).empty
+        return self.fingerprint != new_projected_ei.fingerprint
 
     def prod_centric_changed(self, new_projected_ei: IntensityBenchmarkDataProvider) -> bool:
         prev_prod_centric = self.production_centric
@@ -445,47 +450,21 @@ class VaultProviderIntensityBenchmark(IntensityBenchmarkDataProvider):
         sec_reg_scopes = company_sector_region_scope[["sector", "region", "scope"]]
         if scope_to_calc is not None:
             sec_reg_scopes = sec_reg_scopes[sec_reg_scopes.scope.eq(scope_to_calc)]
-        sec_reg_scopes_mi = pd.MultiIndex.from_frame(sec_reg_scopes).unique()
         bm_proj_t = self._EI_df_t.loc[
             range(
                 self.projection_controls.BASE_YEAR,
                 self.projection_controls.TARGET_YEAR + 1,
-            ),
-            # Here we gather all requested combos as well as ensuring we have 'Global' regional coverage
-            # for sector/scope combinations that arrive with unknown region values
-            [
-                col
-                for col in sec_reg_scopes_mi.append(
-                    pd.MultiIndex.from_frame(sec_reg_scopes.assign(region="Global"))
-                ).unique()
-                if col in self._EI_df_t.columns
-            ],
+            )
         ]
-        # This piece of work essentially does a column-based join (to avoid extra transpositions)
-        result = pd.concat(
-            [
-                (
-                    bm_proj_t[tuple(ser)].rename((idx, ser.iloc[2]))
-                    if tuple(ser) in bm_proj_t
-                    else (
-                        bm_proj_t[ser_global].rename((idx, ser.iloc[2]))
-                        if (
-                            ser_global := (
-                                ser.iloc[0],
-                                "Global",
-                                ser.iloc[2],
-                            )
-                        )
-                        in bm_proj_t
-                        else pd.Series()
-                    )
-                )
-                for idx, ser in sec_reg_scopes.iterrows()
-            ],
-            axis=1,
-        ).dropna(axis=1, how="all")
-        result.columns = pd.MultiIndex.from_tuples(result.columns, names=["company_id", "scope"])
-        return result
+        # This piece of work essentially does a column-based join (to avoid extra transpositions):
+        # every company's benchmark column is gathered with a single take
+        positions = get_benchmark_column_positions(bm_proj_t.columns, sec_reg_scopes)
+        found = positions >= 0
+        result = bm_proj_t.take(positions[found], axis=1)
+        result.columns = pd.MultiIndex.from_arrays(
+            [sec_reg_scopes.index[found], sec_reg_scopes.scope.values[found]], names=["company_id", "scope"]
+        )
+        return result.dropna(axis=1, how="all")
 
     # SDA stands for Sectoral Decarbonization Approach; see https://sciencebasedtargets.org/resources/files/SBTi-Power-Sector-15C-guide-FINAL.pdf
     def get_SDA_intensity_benchmarks(
@@ -1067,6 +1046,9 @@ from {self._v.schema}.{itr_prefix}overshoot_ratios R
     def get_preprocessed_company_data(self, company_ids: List[str]) -> List[ICompanyAggregates]:
         raise NotImplementedError
 
+    def get_preprocessed_company_frame(self, company_ids: List[str]) -> pd.DataFrame:
+        raise NotImplementedError
+
     def get_pa_temp_scores(
         self,
         probability: float,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from enum import Enum
 from typing import Dict, List, Literal, Optional, Union
 
@@ -31,8 +32,12 @@ from .data.osc_units import (
     ProductionMetric,
     ProductionQuantity,
     Quantity,
+    _homogeneous_pint_array,
+    asPintSeries,
+    check_MonetaryQuantity,
     delta_degC_Quantity,
     percent_Quantity,
+    to_Quantity,
     ureg,
 )
 
@@ -227,6 +232,74 @@ class PortfolioCompany(BaseModel):
     user_fields: Optional[Dict[str, str]] = {}
 
 
+class DF_PortfolioCompanies(Sequence):
+    """
+    A portfolio held as a DataFrame with one row per PortfolioCompany.  The columns are validated as a whole
+    rather than row by row, so large portfolios load quickly.  For compatibility with code expecting a
+    List[PortfolioCompany], it is also a sequence of PortfolioCompany models (built on demand).
+    """
+
+    def __init__(self, df_portfolio: pd.DataFrame):
+        """
+        :param df_portfolio: The portfolio. Columns other than the attribute names of the PortfolioCompany model are ignored.
+        """
+        missing_columns = [
+            col for col in ["company_name", "company_id", "investment_value"] if col not in df_portfolio.columns
+        ]
+        if missing_columns:
+            raise ValueError(f"Portfolio is missing columns {missing_columns}")
+        for col in ["company_name", "company_id", "investment_value"]:
+            if df_portfolio[col].isnull().any():
+                raise ValueError(f"Portfolio column {col} is missing values for one or more companies")
+        df = pd.DataFrame(
+            {
+                "company_name": df_portfolio["company_name"].astype(str),
+                "company_id": df_portfolio["company_id"].astype(str),
+            }
+        )
+        if "company_isin" in df_portfolio.columns:
+            df["company_isin"] = df_portfolio["company_isin"].map(lambda x: None if pd.isna(x) else str(x))
+        else:
+            df["company_isin"] = ""
+        investment_value = df_portfolio["investment_value"]
+        if isinstance(investment_value.dtype, PintType):
+            currencies = {investment_value.pint.u}
+        else:
+            # Quantities (or strings such as "100 USD") in an object column
+            investment_value = investment_value.map(lambda x: to_Quantity(x) if isinstance(x, str) else x)
+            pint_array = _homogeneous_pint_array(investment_value.to_numpy())
+            if pint_array is not None:
+                investment_value = pd.Series(pint_array, index=investment_value.index)
+                currencies = {investment_value.pint.u}
+            else:
+                if not all(isinstance(x, Quantity) for x in investment_value):
+                    raise ValueError("Portfolio column investment_value must hold monetary quantities")
+                currencies = {x.u for x in investment_value}
+                if len(currencies) == 1:
+                    investment_value = asPintSeries(investment_value, errors="raise")
+                # Otherwise each holding keeps its own currency, just as its PortfolioCompany does
+        for currency in currencies:
+            check_MonetaryQuantity(Q_(1, currency))
+        df["investment_value"] = investment_value
+        if "user_fields" in df_portfolio.columns:
+            df["user_fields"] = df_portfolio["user_fields"].map(lambda x: x if isinstance(x, dict) else {})
+        self.df = df.reset_index(drop=True)
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self)))]
+        return PortfolioCompany.model_validate(self.df.iloc[item].to_dict())
+
+    def to_portfolio_companies(self) -> List[PortfolioCompany]:
+        """
+        :return: The portfolio as a list of PortfolioCompany models
+        """
+        return list(self)
+
+
 # U is Unquantified, which is presently how our benchmarks come in (production_metric comes in elsewhere)
 class UProjection(BaseModel):
     year: int
@@ -430,7 +503,8 @@ class DF_ICompanyEIProjections(BaseModel):
                 name="value",
             )
         else:
-            projections = projections.astype(f"pint[{str(ei_metric)}]")
+            # Don't copy projections that are already in the right units (they may be views of a larger matrix)
+            projections = projections.astype(f"pint[{str(ei_metric)}]", copy=False)
         super().__init__(ei_metric=str(ei_metric), projections=projections)
 
 
@@ -1,18 +1,24 @@
 import itertools
 import logging
 import warnings  # needed until apply behaves better with Pint quantities in arrays
-from typing import List, Optional, Tuple, Type
+from typing import List, Optional, Tuple, Type, Union
 
 import pandas as pd
 
 import ITR
 
-from .configs import ColumnsConfig, LoggingConfig, TemperatureScoreConfig
+from .configs import (
+    ColumnsConfig,
+    LoggingConfig,
+    TemperatureScoreConfig,
+    TemperatureScoreControls,
+)
 from .data.data_warehouse import DataWarehouse
 from .data.osc_units import Q_, delta_degC_Quantity, ureg
 from .interfaces import (
     Aggregation,
     AggregationContribution,
+    DF_PortfolioCompanies,
     EScope,
     EScoreResultType,
     ETimeFrames,
@@ -38,6 +44,8 @@ class TemperatureScore(PortfolioAggregation):
     :param config: A class defining the constants that are used throughout this class. This parameter is only required
                     if you'd like to overwrite a constant. This can be done by extending the TemperatureScoreConfig
                     class and overwriting one of the parameters.
+    :param controls: The TCRE, target probability, etc. used by this instance (config.CONTROLS_CONFIG if None).
+                    Controls belong to the instance, so instances with different controls can score concurrently.
     """
 
     def __init__(
@@ -49,9 +57,11 @@ class TemperatureScore(PortfolioAggregation):
         budget_column: str = ColumnsConfig.CUMULATIVE_BUDGET,
         grouping: Optional[List] = None,
         config: Type[TemperatureScoreConfig] = TemperatureScoreConfig,
+        controls: Optional[TemperatureScoreControls] = None,
     ):
         super().__init__(config)
         self.c: Type[TemperatureScoreConfig] = config
+        self._controls = controls
         self.fallback_score = fallback_score
 
         self.time_frames = time_frames
@@ -63,6 +73,10 @@ class TemperatureScore(PortfolioAggregation):
         if grouping is not None:
             self.grouping = grouping
 
+    @property
+    def controls(self) -> TemperatureScoreControls:
+        return self.c.CONTROLS_CONFIG if self._controls is None else self._controls
+
     def get_score(self, scorable_row: pd.Series) -> Tuple[
         delta_degC_Quantity,
         delta_degC_Quantity,
@@ -102,7 +116,7 @@ class TemperatureScore(PortfolioAggregation):
             trajectory_temperature_score = scorable_row[self.c.COLS.BENCHMARK_TEMP] + (
                 scorable_row[self.c.COLS.BENCHMARK_GLOBAL_BUDGET]
                 * (trajectory_overshoot_ratio - 1.0)
-                * self.c.CONTROLS_CONFIG.tcre_multiplier
+                * self.controls.tcre_multiplier
             )
             score = trajectory_temperature_score
             return (
@@ -122,12 +136,12 @@ class TemperatureScore(PortfolioAggregation):
             target_temperature_score = scorable_row[self.c.COLS.BENCHMARK_TEMP] + (
                 scorable_row[self.c.COLS.BENCHMARK_GLOBAL_BUDGET]
                 * (target_overshoot_ratio - 1.0)
-                * self.c.CONTROLS_CONFIG.tcre_multiplier
+                * self.controls.tcre_multiplier
             )
             trajectory_temperature_score = scorable_row[self.c.COLS.BENCHMARK_TEMP] + (
                 scorable_row[self.c.COLS.BENCHMARK_GLOBAL_BUDGET]
                 * (trajectory_overshoot_ratio - 1.0)
-                * self.c.CONTROLS_CONFIG.tcre_multiplier
+                * self.controls.tcre_multiplier
             )
 
             # If trajectory data has run away (because trajectory projections are positive, not negative, use only target results
@@ -313,7 +327,7 @@ class TemperatureScore(PortfolioAggregation):
         self,
         data: Optional[pd.DataFrame] = None,
         data_warehouse: Optional[DataWarehouse] = None,
-        portfolio: Optional[List[PortfolioCompany]] = None,
+        portfolio: Optional[Union[DF_PortfolioCompanies, List[PortfolioCompany]]] = None,
         target_probability: Optional[float] = None,
     ):
         """
@@ -322,13 +336,13 @@ class TemperatureScore(PortfolioAggregation):
 
         :param data: The data set (or None if the data should be retrieved)
         :param data_warehouse: A list of DataProvider instances. Optional, only required if data is empty.
-        :param portfolio: A list of PortfolioCompany models. Optional, only required if data is empty.
+        :param portfolio: The portfolio companies (or a list of PortfolioCompany models). Optional, only required if data is empty.
         :return: A data frame containing all relevant information for the targets and companies
         """
         if portfolio is not None:
             logger.info(f"calculating temperature score for {len(portfolio)} companies")
         if target_probability is None:
-            target_probability = TemperatureScoreConfig.CONTROLS_CONFIG.target_probability
+            target_probability = self.controls.target_probability
         if data is None:
             if data_warehouse is not None and portfolio is not None:
                 from . import utils
@@ -461,9 +475,11 @@ class TemperatureScore(PortfolioAggregation):
                 return score_aggregation
             elif len(self.grouping) == 1:
                 # Silence deprecation warning issuing from this change: https://github.com/pandas-dev/pandas/issues/42795
-                self.grouping = self.grouping[0]
+                grouping = self.grouping[0]
+            else:
+                grouping = self.grouping
 
-            grouped_data = filtered_data.groupby(self.grouping)
+            grouped_data = filtered_data.groupby(grouping)
             for group_names, group in grouped_data:
                 group_name_joined = (
                     group_names
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import sys
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -17,8 +17,9 @@ from .configs import (
     TemperatureScoreControls,
 )
 from .data.data_warehouse import DataWarehouse
-from .data.osc_units import Q_, asPintSeries, delta_degC_Quantity
-from .interfaces import EScope, ETimeFrames, PortfolioCompany, ScoreAggregations
+from .data import PA_, PintType
+from .data.osc_units import Q_, Quantity, asPintSeries, delta_degC_Quantity
+from .interfaces import DF_PortfolioCompanies, EScope, ETimeFrames, PortfolioCompany, ScoreAggregations
 from .portfolio_aggregation import PortfolioAggregationMethod
 from .temperature_score import TemperatureScore
 
@@ -63,12 +64,12 @@ def _make_isin_map(df_portfolio: pd.DataFrame) -> dict:
     }
 
 
-def dataframe_to_portfolio(df_portfolio: pd.DataFrame) -> List[PortfolioCompany]:
+def dataframe_to_portfolio(df_portfolio: pd.DataFrame) -> DF_PortfolioCompanies:
     """
-    Convert a data frame to a list of portfolio company objects.
+    Convert a data frame to a portfolio of companies.
 
     :param df_portfolio: The data frame to parse. The column names should align with the attribute names of the PortfolioCompany model.
-    :return: A list of portfolio companies
+    :return: The portfolio companies, which may also be used as a list of PortfolioCompany models
     """
     # Adding some non-empty checks for portfolio upload
     if df_portfolio[ColumnsConfig.INVESTMENT_VALUE].isnull().any():
@@ -84,43 +85,77 @@ def dataframe_to_portfolio(df_portfolio: pd.DataFrame) -> List[PortfolioCompany]
         logger.error(error_message)
         raise ValueError(error_message)
 
-    return [PortfolioCompany.model_validate(company) for company in df_portfolio.to_dict(orient="records")]
+    return DF_PortfolioCompanies(df_portfolio)
 
 
-def get_data(data_warehouse: DataWarehouse, portfolio: List[PortfolioCompany]) -> pd.DataFrame:
+def _flatten_portfolio_frame(portfolio: DF_PortfolioCompanies, company_ids: set) -> pd.DataFrame:
+    """
+    Select the companies of a portfolio that are in COMPANY_IDS, flattening any user fields into columns.
+
+    :param portfolio: The portfolio
+    :param company_ids: The company_ids to select
+    :return: The selected rows of the portfolio
+    """
+    df_portfolio = portfolio.df[portfolio.df[ColumnsConfig.COMPANY_ID].isin(company_ids)].reset_index(drop=True)
+    if not isinstance(df_portfolio[ColumnsConfig.INVESTMENT_VALUE].dtype, PintType):
+        # Holdings in several currencies are converted just as those of a List[PortfolioCompany] are
+        df_portfolio[ColumnsConfig.INVESTMENT_VALUE] = asPintSeries(df_portfolio[ColumnsConfig.INVESTMENT_VALUE])
+    if "user_fields" in df_portfolio.columns:
+        df_portfolio = pd.concat(
+            [
+                df_portfolio.drop(columns="user_fields"),
+                pd.DataFrame.from_records(df_portfolio["user_fields"].to_list(), index=df_portfolio.index),
+            ],
+            axis=1,
+        )
+    return df_portfolio
+
+
+def get_data(
+    data_warehouse: DataWarehouse, portfolio: Union[DF_PortfolioCompanies, List[PortfolioCompany]]
+) -> pd.DataFrame:
     """
     Get the required data from the data provider(s) and return a 9-box grid for each company.
 
     :param data_warehouse: DataWarehouse instances
-    :param portfolio: A list of PortfolioCompany models
+    :param portfolio: The portfolio companies (such as from dataframe_to_portfolio) or a list of PortfolioCompany models
     :return: A data frame containing the relevant company data indexed by (COMPANY_ID, SCOPE)
     """
     company_ids = set(data_warehouse.company_data.get_company_ids())
-    df_portfolio = pd.DataFrame.from_records(
-        [_flatten_user_fields(c) for c in portfolio if c.company_id in company_ids]
-    )
-    df_portfolio[ColumnsConfig.INVESTMENT_VALUE] = asPintSeries(df_portfolio[ColumnsConfig.INVESTMENT_VALUE])
+    if isinstance(portfolio, DF_PortfolioCompanies):
+        df_portfolio = _flatten_portfolio_frame(portfolio, company_ids)
+    else:
+        df_portfolio = pd.DataFrame.from_records(
+            [_flatten_user_fields(c) for c in portfolio if c.company_id in company_ids]
+        )
+        df_portfolio[ColumnsConfig.INVESTMENT_VALUE] = asPintSeries(df_portfolio[ColumnsConfig.INVESTMENT_VALUE])
 
     if ColumnsConfig.COMPANY_ID not in df_portfolio.columns:
         raise ValueError("Portfolio contains no company_id data")
 
-    # This transforms a dataframe of portfolio data into model data just so we can transform that back into a dataframe?!
-    # It does this for all scopes, not only the scopes of interest
-    company_data = data_warehouse.get_preprocessed_company_data(df_portfolio[ColumnsConfig.COMPANY_ID].to_list())
+    # The warehouse's preprocessed DataFrame is used as-is, without building (and then unpacking) ICompanyAggregates
+    df_company_data = data_warehouse.get_preprocessed_company_frame(df_portfolio[ColumnsConfig.COMPANY_ID].to_list())
 
-    if len(company_data) == 0:
+    if len(df_company_data) == 0:
         raise ValueError("None of the companies in your portfolio could be found by the data providers")
 
-    df_company_data = pd.DataFrame.from_records([dict(c) for c in company_data])
+    df_company_data = df_company_data.reset_index(drop=True)
     # Until we have https://github.com/hgrecco/pint-pandas/pull/58...
     df_company_data.ghg_s1s2 = df_company_data.ghg_s1s2.astype("pint[Mt CO2e]")
-    s3_data_invalid = df_company_data[ColumnsConfig.GHG_SCOPE3].isna()
-    if len(s3_data_invalid[s3_data_invalid].index) > 0:
-        df_company_data.loc[s3_data_invalid, ColumnsConfig.GHG_SCOPE3] = df_company_data.loc[
-            s3_data_invalid, ColumnsConfig.GHG_SCOPE3
-        ].map(lambda x: Q_(np.nan, "Mt CO2e"))
+    # Missing S3 data (None) becomes NaN Mt CO2e
+    df_company_data[ColumnsConfig.GHG_SCOPE3] = pd.Series(
+        PA_(
+            np.array(
+                [
+                    x.to("Mt CO2e").m if isinstance(x, Quantity) else np.nan
+                    for x in df_company_data[ColumnsConfig.GHG_SCOPE3]
+                ]
+            ),
+            "Mt CO2e",
+        ),
+        index=df_company_data.index,
+    )
     for col in [
-        ColumnsConfig.GHG_SCOPE3,
         ColumnsConfig.CUMULATIVE_BUDGET,
         ColumnsConfig.CUMULATIVE_SCALED_BUDGET,
         ColumnsConfig.CUMULATIVE_TARGET,
@@ -136,12 +171,20 @@ def get_data(data_warehouse: DataWarehouse, portfolio: List[PortfolioCompany]) -
         ColumnsConfig.COMPANY_CASH_EQUIVALENTS,
     ]:
         df_company_data[col] = asPintSeries(df_company_data[col])
-    df_company_data[ColumnsConfig.BENCHMARK_TEMP] = df_company_data[ColumnsConfig.BENCHMARK_TEMP].astype(
-        "pint[delta_degC]"
+    # The warehouse gives benchmark temperatures as strings; parse each distinct one just once
+    benchmark_temps = {
+        benchmark_temp: Q_(benchmark_temp).to("delta_degC").m
+        for benchmark_temp in df_company_data[ColumnsConfig.BENCHMARK_TEMP].unique()
+    }
+    df_company_data[ColumnsConfig.BENCHMARK_TEMP] = pd.Series(
+        PA_(df_company_data[ColumnsConfig.BENCHMARK_TEMP].map(benchmark_temps).to_numpy(), "delta_degC"),
+        index=df_company_data.index,
     )
     df_company_data[ColumnsConfig.BENCHMARK_GLOBAL_BUDGET] = df_company_data[
         ColumnsConfig.BENCHMARK_GLOBAL_BUDGET
     ].astype("pint[Gt CO2e]")
+    for col in [ColumnsConfig.TRAJECTORY_EXCEEDANCE_YEAR, ColumnsConfig.TARGET_EXCEEDANCE_YEAR]:
+        df_company_data[col] = df_company_data[col].astype("float64")
     portfolio_data = pd.merge(
         left=df_company_data,
         right=df_portfolio.drop(ColumnsConfig.COMPANY_NAME, axis=1),
@@ -228,19 +271,20 @@ def calculate(
     :param grouping: The names of the columns to group on
     :param anonymize: Whether to anonymize the resulting data set or not
     :param aggregate: Whether to aggregate the scores or not
+    :param controls: The temperature score controls (TemperatureScoreConfig.CONTROLS_CONFIG if None)
     :return: The scores, the aggregations and the column distribution (if a
     """
 
-    config = TemperatureScoreConfig
-    if controls:
-        TemperatureScoreConfig.CONTROLS_CONFIG = controls
+    # CONTROLS are given to this calculation's TemperatureScore alone (not set globally), so that calculations
+    # with different controls can run concurrently
     ts = TemperatureScore(
         time_frames=time_frames,
         scopes=scopes,
         fallback_score=fallback_score,
         grouping=grouping,
         aggregation_method=aggregation_method,
-        config=config,
+        config=TemperatureScoreConfig,
+        controls=controls,
     )
 
     scores = ts.calculate(portfolio_data)
@@ -325,7 +369,10 @@ def get_size(obj, seen=None):
     # Important mark as seen *before* entering recursion to gracefully handle
     # self-referential objects
     seen.add(obj_id)
-    if isinstance(obj, dict):
+    if isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        # pandas objects already report their (deep) memory usage to sys.getsizeof
+        pass
+    elif isinstance(obj, dict):
         size += sum([get_size(v, seen) for v in obj.values()])
         size += sum([get_size(k, seen) for k in obj.keys()])
     elif hasattr(obj, "__dict__"):
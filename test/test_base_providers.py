@@ -1,27 +1,38 @@
 import json
 import os
+import shutil
+import tempfile
 import unittest
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
+import numpy as np
 import pandas as pd
 from utils import assert_pint_frame_equal, assert_pint_series_equal
 
 import ITR
 from ITR import data_dir
-from ITR.configs import ColumnsConfig, TemperatureScoreConfig
+from ITR.configs import ColumnsConfig, ProjectionControls, TemperatureScoreConfig
 from ITR.data.base_providers import (
     BaseCompanyDataProvider,
     BaseProviderIntensityBenchmark,
     BaseProviderProductionBenchmark,
+    EITrajectoryProjector,
 )
+from ITR.data.benchmark_bundle import bundle_paths, read_bundle, write_bundle
+from ITR.data.benchmark_registry import BenchmarkRegistry
 from ITR.data.data_warehouse import DataWarehouse
 from ITR.data.osc_units import Q_, asPintSeries, ureg
 from ITR.interfaces import (
+    DF_ICompanyEIProjections,
     EScope,
     ETimeFrames,
     ICompanyData,
     IEIBenchmarkScopes,
+    IHistoricData,
     IProductionBenchmarkScopes,
+    IProductionRealization,
     PortfolioCompany,
 )
 from ITR.portfolio_aggregation import PortfolioAggregationMethod
@@ -310,6 +321,277 @@ class TestBaseProvider(unittest.TestCase):
         self.assertTrue(bm_s1s2.columns.equals(bm_s3.columns))
         self.assertFalse(bm_s1s2.equals(bm_s3))
 
+    def test_benchmark_fingerprint(self):
+        """
+        Benchmarks loaded from the same data have the same fingerprint; changing content or parameters changes it
+        """
+        with open(self.benchmark_EI_json) as json_file:
+            parsed_json = json.load(json_file)
+        same_EI_bm = BaseProviderIntensityBenchmark(EI_benchmarks=IEIBenchmarkScopes.model_validate(parsed_json))
+        self.assertEqual(self.base_EI_bm.fingerprint, same_EI_bm.fingerprint)
+        self.assertFalse(self.base_EI_bm.benchmarks_changed(same_EI_bm))
+
+        parsed_json["S1S2"]["benchmarks"][0]["projections_nounits"][-1]["value"] *= 1.01
+        other_EI_bm = BaseProviderIntensityBenchmark(EI_benchmarks=IEIBenchmarkScopes.model_validate(parsed_json))
+        self.assertTrue(self.base_EI_bm.benchmarks_changed(other_EI_bm))
+
+        same_EI_bm.is_AFOLU_included = not same_EI_bm.is_AFOLU_included
+        self.assertTrue(self.base_EI_bm.benchmarks_changed(same_EI_bm))
+
+        with open(self.benchmark_prod_json) as json_file:
+            parsed_json = json.load(json_file)
+        same_production_bm = BaseProviderProductionBenchmark(
+            production_benchmarks=IProductionBenchmarkScopes.model_validate(parsed_json)
+        )
+        self.assertFalse(self.base_production_bm.benchmark_changed(same_production_bm))
+
+    def test_benchmark_bundle(self):
+        """
+        Benchmarks loaded from a compiled bundle match those loaded from JSON, and editing the JSON recompiles the bundle
+        """
+        with (
+            tempfile.TemporaryDirectory() as tmp_dir,
+            mock.patch.dict(os.environ, {"ITR_BUNDLE_DIR": os.path.join(tmp_dir, "bundles")}),
+        ):
+            json_path = os.path.join(tmp_dir, "benchmark_EI_TPI_2_degrees.json")
+            shutil.copy(os.path.join(data_dir, "benchmark_EI_TPI_2_degrees.json"), json_path)
+            compiled_bm = BaseProviderIntensityBenchmark.from_json(json_path)
+            self.assertIsNotNone(read_bundle(json_path))
+            self.assertTrue(all(os.path.exists(path) for path in bundle_paths(json_path)))
+            self.assertTrue(bundle_paths(json_path)[0].startswith(os.path.join(tmp_dir, "bundles")))
+            bundled_bm = BaseProviderIntensityBenchmark.from_json(json_path)
+            self.assertIsNone(bundled_bm._EI_benchmarks_model)
+            assert_pint_frame_equal(self, compiled_bm._EI_df_t, bundled_bm._EI_df_t)
+            self.assertFalse(compiled_bm.benchmarks_changed(bundled_bm))
+            self.assertEqual(compiled_bm.get_scopes(), bundled_bm.get_scopes())
+
+            with open(json_path) as json_file:
+                parsed_json = json.load(json_file)
+            parsed_json["S1S2"]["benchmarks"][0]["projections_nounits"][-1]["value"] *= 1.01
+            with open(json_path, "w") as json_file:
+                json.dump(parsed_json, json_file)
+            self.assertIsNone(read_bundle(json_path))
+            edited_bm = BaseProviderIntensityBenchmark.from_json(json_path)
+            self.assertTrue(compiled_bm.benchmarks_changed(edited_bm))
+            self.assertIsNotNone(read_bundle(json_path))
+
+            production_json_path = os.path.join(tmp_dir, "benchmark_production_OECM.json")
+            shutil.copy(self.benchmark_prod_json, production_json_path)
+            BaseProviderProductionBenchmark.from_json(production_json_path)
+            bundled_production_bm = BaseProviderProductionBenchmark.from_json(production_json_path)
+            self.assertIsNone(bundled_production_bm._productions_benchmarks_model)
+            assert_pint_frame_equal(self, self.base_production_bm._prod_df, bundled_production_bm._prod_df)
+            self.assertFalse(self.base_production_bm.benchmark_changed(bundled_production_bm))
+
+            # An unwritable bundle directory is only warned about once
+            unwritable_dir = os.path.join(json_path, "bundles")
+            with self.assertLogs("ITR.data.benchmark_bundle", level="WARNING"):
+                self.assertFalse(write_bundle(json_path, {}, {}, bundle_dir=unwritable_dir))
+            with self.assertNoLogs("ITR.data.benchmark_bundle", level="WARNING"):
+                self.assertFalse(write_bundle(json_path, {}, {}, bundle_dir=unwritable_dir))
+
+    def test_benchmark_registry(self):
+        """
+        Registered benchmarks load on first use, are shared while resident, and the least recently used is dropped first
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for filename in [
+                "benchmark_production_OECM.json",
+                "benchmark_EI_TPI_2_degrees.json",
+                "benchmark_EI_TPI_1_5_degrees.json",
+            ]:
+                shutil.copy(os.path.join(data_dir, filename), tmp_dir)
+            registry = BenchmarkRegistry(tmp_dir, max_resident=2)
+            self.assertEqual(registry.available_intensity_benchmarks(), ["TPI_1_5_degrees", "TPI_2_degrees"])
+            self.assertEqual(registry.resident_benchmarks(), [])
+
+            production_bm = registry.get_production_benchmark()
+            EI_bm = registry.get_intensity_benchmark("TPI_2_degrees")
+            self.assertIs(EI_bm, registry.get_intensity_benchmark("TPI_2_degrees"))
+            self.assertFalse(self.base_production_bm.benchmark_changed(production_bm))
+            self.assertEqual(
+                registry.resident_benchmarks(),
+                ["benchmark_production_OECM.json", "benchmark_EI_TPI_2_degrees.json"],
+            )
+
+            registry.get_intensity_benchmark("TPI_1_5_degrees")
+            self.assertEqual(
+                registry.resident_benchmarks(),
+                ["benchmark_EI_TPI_2_degrees.json", "benchmark_EI_TPI_1_5_degrees.json"],
+            )
+            self.assertIsNot(production_bm, registry.get_production_benchmark())
+            self.assertFalse(production_bm.benchmark_changed(registry.get_production_benchmark()))
+            with self.assertRaises(ValueError):
+                registry.get_intensity_benchmark("OECM_S3")
+
+            # Benchmarks projected over different years are separate instances
+            EI_bm = registry.get_intensity_benchmark("TPI_2_degrees")
+            EI_bm_2025 = registry.get_intensity_benchmark("TPI_2_degrees", ProjectionControls(BASE_YEAR=2025))
+            self.assertIsNot(EI_bm, EI_bm_2025)
+            self.assertEqual(EI_bm_2025.projection_controls.BASE_YEAR, 2025)
+            self.assertIs(
+                EI_bm_2025, registry.get_intensity_benchmark("TPI_2_degrees", ProjectionControls(BASE_YEAR=2025))
+            )
+
+            # Concurrent first uses of a benchmark share a single load
+            registry.clear()
+            with (
+                mock.patch.object(
+                    BaseProviderIntensityBenchmark, "from_json", wraps=BaseProviderIntensityBenchmark.from_json
+                ) as from_json,
+                ThreadPoolExecutor(4) as executor,
+            ):
+                EI_bms = list(executor.map(lambda _: registry.get_intensity_benchmark("TPI_1_5_degrees"), range(4)))
+            self.assertEqual(from_json.call_count, 1)
+            self.assertTrue(all(bm is EI_bms[0] for bm in EI_bms))
+
+    def test_trajectory_variants(self):
+        """
+        Trajectory variants can be computed with or without an EI benchmark
+        """
+        variants = [ProjectionControls(), ProjectionControls(LOWER_DELTA=-0.05)]
+        stacked = self.base_warehouse.get_trajectory_variants(variants)
+        self.assertEqual(stacked.index.get_level_values("variant").unique().to_list(), [0, 1])
+        no_bm_warehouse = DataWarehouse(self.base_company_data, None, None)
+        self.assertEqual(no_bm_warehouse.get_trajectory_variants(variants).shape, stacked.shape)
+
+    def test_memory_report(self):
+        """
+        The memory report accounts for each category of warehouse data and follows changes to that data
+        """
+        report = self.base_warehouse.memory_report()
+        self.assertEqual(
+            list(report),
+            [
+                "historic_data",
+                "projected_intensities",
+                "projected_targets",
+                "orig_historic_data",
+                "company_store",
+                "benchmarks",
+                "total",
+            ],
+        )
+        self.assertTrue(all(size > 0 for size in report.values()))
+        self.assertEqual(report["total"], sum(report.values()) - report["total"])
+        # A sampled report is an estimate of the full one
+        sampled = self.base_warehouse.memory_report(sample_size=3)
+        self.assertAlmostEqual(sampled["total"], report["total"], delta=report["total"] * 0.5)
+        # Company data changed outside of update_benchmarks and update_trajectories is measured too
+        for company in self.base_warehouse.company_data._companies:
+            company.projected_targets = None
+        self.assertLess(self.base_warehouse.memory_report()["projected_targets"], report["projected_targets"])
+
+    def test_allocate_emissions(self):
+        """
+        Emissions of a split company are allocated to its sectors, and a split company without historic emissions is
+        left alone
+        """
+        company = self.companies[0]
+        split_company = company.model_copy(
+            update={
+                "company_id": f"{company.company_id}+{company.sector}",
+                "historic_data": company.historic_data.model_copy(deep=True),
+            }
+        )
+        empty_company = company.model_copy(
+            update={"company_id": "X+Electricity Utilities", "historic_data": IHistoricData()}
+        )
+        self.base_company_data._bm_allocation_index = pd.MultiIndex.from_tuples(
+            [(split_company.company_id, "S1S2"), (empty_company.company_id, "S1S2")]
+        )
+        with self.assertLogs("ITR.data.base_providers", level="INFO") as logs:
+            self.base_company_data._allocate_emissions(
+                [empty_company], self.base_EI_bm, self.base_company_data.get_projection_controls()
+            )
+        self.assertIn("Sector alignment complete", logs.output[-1])
+        self.assertEqual(empty_company.historic_data.emissions.S1S2, [])
+
+        # The only sector of a split company gets all of its emissions
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.base_company_data._allocate_emissions(
+                [split_company], self.base_EI_bm, self.base_company_data.get_projection_controls()
+            )
+        emissions = split_company.historic_data.emissions.S1S2
+        np.testing.assert_allclose(
+            [em.value.to("t CO2e").m for em in emissions],
+            [em.value.m for em in company.historic_data.emissions.S1S2],
+        )
+        intensities = split_company.historic_data.emissions_intensities.S1S2
+        np.testing.assert_allclose(
+            [ei.value.to("t CO2e/MWh").m for ei in intensities],
+            [
+                em.value.m / prod.value.m
+                for em, prod in zip(company.historic_data.emissions.S1S2, company.historic_data.productions)
+            ],
+        )
+
+    def test_misaligned_production(self):
+        """
+        A company whose production cannot be aligned with its benchmark intensity is reported and skipped
+        """
+        company = self.companies[0]
+        historic_data = company.historic_data.model_copy(deep=True)
+        historic_data.productions = [
+            IProductionRealization(year=p.year, value=Q_(p.value.m, "t Steel")) for p in historic_data.productions
+        ]
+        misaligned_company = company.model_copy(
+            update={
+                "company_id": "steel_utility",
+                "production_metric": "t Steel",
+                "historic_data": historic_data,
+                "projected_intensities": None,
+            }
+        )
+        projector = EITrajectoryProjector(ei_df_t=self.base_EI_bm._EI_df_t)
+        with self.assertLogs("ITR.data.base_providers", level="WARNING") as logs:
+            projections = projector.project_ei_trajectories([misaligned_company, self.companies[1]])
+        self.assertTrue(any("Ignoring unalignable production metrics" in msg for msg in logs.output))
+        self.assertTrue(any("steel_utility" in msg for msg in logs.output))
+        self.assertEqual([c.company_id for c in projections], ["steel_utility", self.companies[1].company_id])
+
+    def test_normalize_projection_units(self):
+        """
+        Projections in units other than those of their benchmark are rescaled and relabelled
+        """
+        company = self.base_company_data._companies[0]
+        projections = company.projected_intensities.S1S2.projections
+        bm_units = projections.dtype.units
+        kg_company = company.model_copy(
+            update={
+                "company_id": "kg_utility",
+                "projected_intensities": company.projected_intensities.model_copy(
+                    update={
+                        "S1S2": DF_ICompanyEIProjections(
+                            ei_metric="kg CO2e/MWh", projections=projections.pint.to("kg CO2e/MWh")
+                        )
+                    }
+                ),
+            }
+        )
+        self.base_company_data._validate_projected_trajectories([kg_company], self.base_EI_bm)
+        normalized = kg_company.projected_intensities.S1S2
+        self.assertEqual(normalized.projections.dtype.units, bm_units)
+        self.assertEqual(str(normalized.ei_metric), str(bm_units))
+        assert_pint_series_equal(self, normalized.projections, projections)
+
+    def test_get_benchmark_paths_shared(self):
+        """
+        SDA paths are computed once per benchmark and shared by every company that maps to that benchmark
+        """
+        benchmarks = self.base_EI_bm.get_SDA_intensity_benchmarks(self.company_info_at_base_year)
+        sda_paths = self.base_EI_bm._get_SDA_paths()
+        self.assertIs(sda_paths, self.base_EI_bm._get_SDA_paths())
+
+        # Two companies in the same sector and region get the same path
+        company_info = self.company_info_at_base_year.iloc[[0, 0]]
+        company_info.index = pd.Index(["twin_1", "twin_2"], name=company_info.index.name)
+        twins = self.base_EI_bm.get_SDA_intensity_benchmarks(company_info)
+        self.assertEqual(twins.index.get_level_values("company_id").to_list(), ["twin_1", "twin_2"])
+        self.assertEqual(twins.iloc[0].to_list(), twins.iloc[1].to_list())
+        self.assertEqual(twins.iloc[0].to_list(), benchmarks.iloc[0].to_list())
+
     def test_get_projected_production(self):
         # Note that 40763845.66650752 MWh = 146749844.39942706 gigajoule
         # expected_data_2025 is all MWh, but productions vector is heterogeneous
@@ -327,6 +609,25 @@ class TestBaseProvider(unittest.TestCase):
         productions = self.base_production_bm.get_company_projected_production(self.company_info_at_base_year)[2025]
         assert_pint_series_equal(self, expected_data_2025, productions)
 
+    def test_get_projected_production_cached(self):
+        """
+        Benchmark positions are resolved once per sector and region, and unknown regions fall back to 'Global'
+        """
+        productions = self.base_production_bm.get_company_projected_production(self.company_info_at_base_year)
+        sector_regions = set(self.base_production_bm._company_bm_positions)
+        self.assertEqual(
+            productions.values.tolist(),
+            self.base_production_bm.get_company_projected_production(self.company_info_at_base_year).values.tolist(),
+        )
+        self.assertEqual(sector_regions, set(self.base_production_bm._company_bm_positions))
+
+        company_info = self.company_info_at_base_year.iloc[[0]].assign(region="Atlantis")
+        global_info = self.company_info_at_base_year.iloc[[0]].assign(region="Global")
+        self.assertEqual(
+            self.base_production_bm.get_company_projected_production(company_info).values.tolist(),
+            self.base_production_bm.get_company_projected_production(global_info).values.tolist(),
+        )
+
     def test_get_projected_targets(self):
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
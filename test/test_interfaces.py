@@ -1,17 +1,28 @@
 import unittest
 
+import numpy as np
 import pandas as pd
+from pint import Context, DimensionalityError
 
 import ITR  # noqa F401
 from ITR.configs import TemperatureScoreConfig
 from ITR.data.osc_units import (
+    PA_,
     Q_,
     BenchmarkMetric,
     EI_Metric,
     EI_Quantity,
     ProductionMetric,
+    _homogeneous_pint_array,
+    align_production_to_bm,
+    asPintDataFrame,
+    asPintSeries,
+    conversion_factor,
+    parse_units,
+    ureg,
 )
 from ITR.interfaces import (
+    DF_PortfolioCompanies,
     EScope,
     IBenchmark,
     ICompanyData,
@@ -19,6 +30,7 @@ from ITR.interfaces import (
     ICompanyEIProjections,
     ICompanyEIProjectionsScopes,
     ITargetData,
+    PortfolioCompany,
     UProjection,
 )
 
@@ -113,3 +125,109 @@ class TestInterfaces(unittest.TestCase):
                 target_base_year_unit="t CO2",
                 target_reduction_pct=0.2,
             )
+
+    def test_DF_PortfolioCompanies(self):
+        df_portfolio = pd.DataFrame(
+            {
+                "company_name": ["Company A", "Company B"],
+                "company_lei": ["LEI A", "LEI B"],
+                "company_id": ["US0079031078", "US00724F1012"],
+                "company_isin": ["US0079031078", "US00724F1012"],
+                "investment_value": pd.Series(PA_([100.0, 200.0], "EUR")),
+            }
+        )
+        portfolio = DF_PortfolioCompanies(df_portfolio)
+        self.assertEqual(len(portfolio), 2)
+        self.assertEqual(
+            portfolio[1],
+            PortfolioCompany(
+                company_name="Company B",
+                company_id="US00724F1012",
+                company_isin="US00724F1012",
+                investment_value=Q_(200.0, "EUR"),
+            ),
+        )
+        self.assertEqual(portfolio.to_portfolio_companies(), [portfolio[0], portfolio[1]])
+        # Quantities in an object column are accepted, but they must be monetary
+        df_portfolio["investment_value"] = [Q_(100.0, "USD"), "200 USD"]
+        self.assertEqual(DF_PortfolioCompanies(df_portfolio)[1].investment_value, Q_(200, "USD"))
+        # Holdings in different currencies each keep their own
+        df_portfolio["investment_value"] = [Q_(100.0, "USD"), "200 EUR"]
+        self.assertEqual(
+            [c.investment_value for c in DF_PortfolioCompanies(df_portfolio)], [Q_(100.0, "USD"), Q_(200.0, "EUR")]
+        )
+        df_portfolio["investment_value"] = [Q_(100.0, "USD"), Q_(200.0, "t CO2")]
+        with self.assertRaises(DimensionalityError):
+            DF_PortfolioCompanies(df_portfolio)
+        df_portfolio["investment_value"] = [Q_(100.0, "USD"), 200.0]
+        with self.assertRaises(ValueError):
+            DF_PortfolioCompanies(df_portfolio)
+        df_portfolio["investment_value"] = [Q_(100.0, "t CO2"), Q_(200.0, "t CO2")]
+        with self.assertRaises(DimensionalityError):
+            DF_PortfolioCompanies(df_portfolio)
+
+    def test_conversion_factor(self):
+        self.assertEqual(conversion_factor("Mt CO2", "t CO2"), 1e6)
+        self.assertIs(parse_units("t CO2/MWh"), parse_units("t CO2/MWh"))
+        self.assertEqual(ITR.Q_m_as(Q_(20.0, "degC"), "K"), 293.15)
+        self.assertAlmostEqual(ITR.Q_m_as(Q_(300.0, "K"), "degC"), 26.85)
+        with self.assertRaises(ValueError):
+            conversion_factor("K", "degC")
+        temperature = Q_(300.0, "K")
+        self.assertAlmostEqual(ITR.Q_m_as(temperature, "degC", inplace=True), 26.85)
+        self.assertEqual(temperature.u, ureg.degC)
+        with self.assertRaises(DimensionalityError):
+            conversion_factor("t CO2", "MWh")
+        # Cached factors follow redefinitions in active contexts
+        fx_ctx = Context("test_FX")
+        fx_ctx.redefine("CHF = 1.1 USD")
+        ureg.add_context(fx_ctx)
+        try:
+            with ureg.context("test_FX"):
+                self.assertAlmostEqual(conversion_factor("CHF", "USD"), 1.1)
+            fx_ctx.redefine("CHF = 1.2 USD")
+            with ureg.context("test_FX"):
+                self.assertAlmostEqual(conversion_factor("CHF", "USD"), 1.2)
+        finally:
+            ureg.remove_context("test_FX")
+
+    def test_asPintSeries(self):
+        # Homogeneous units (with NaNs) and mixed units both give PintArrays
+        homogeneous = pd.Series([Q_(1.5, "t CO2"), np.nan, Q_(2.0, "t CO2")], index=[3, 1, 2], name="ghg")
+        result = asPintSeries(homogeneous)
+        self.assertEqual(result.dtype, "pint[t CO2]")
+        self.assertEqual(result.index.to_list(), [3, 1, 2])
+        self.assertEqual(result.name, "ghg")
+        self.assertEqual(result.pint.m.fillna(-1.0).to_list(), [1.5, -1.0, 2.0])
+        mixed = pd.Series([Q_(1.0, "t CO2"), Q_(500.0, "kg CO2"), Q_(3.0, "t CO2")])
+        self.assertEqual(asPintSeries(mixed).pint.m.to_list(), [1.0, 0.5, 3.0])
+        # A single element in other units sends the whole column down the slow path
+        mostly_tonnes = pd.Series([Q_(float(i), "t CO2") for i in range(100)])
+        mostly_tonnes[37] = Q_(500.0, "kg CO2")
+        self.assertIsNone(_homogeneous_pint_array(mostly_tonnes.to_numpy()))
+        result = asPintSeries(mostly_tonnes)
+        self.assertEqual(result.dtype, "pint[t CO2]")
+        self.assertEqual(result.pint.m[37], 0.5)
+
+        df = pd.DataFrame(
+            {("S1", 2020): homogeneous.to_list(), ("S1", 2021): mixed.to_list(), ("S2", 2020): [1.0, 2.0, 3.0]},
+            index=pd.Index(["a", "b", "a"]),
+        )
+        result = asPintDataFrame(df)
+        self.assertTrue(result.columns.equals(df.columns))
+        self.assertTrue(result.index.equals(df.index))
+        self.assertEqual([str(dtype) for dtype in result.dtypes], ["pint[CO2 * metric_ton]"] * 2 + ["float64"])
+
+    def test_align_production_to_bm(self):
+        ei_bm = pd.Series(PA_([0.5, 0.4], "t CO2e/GJ"))
+        aligned = align_production_to_bm(pd.Series(PA_([1.0, 2.0], "MWh"), index=[2020, 2021]), ei_bm)
+        self.assertEqual(aligned.dtype, "pint[GJ]")
+        self.assertEqual(aligned.index.to_list(), [2020, 2021])
+        self.assertEqual(aligned.pint.m.to_list(), [3.6, 7.2])
+        # The mass simplified out of t CO2e / t Steel is restored from the production units
+        aligned = align_production_to_bm(
+            pd.Series([Q_(1.0, "kt Steel"), Q_(2.0, "kt Steel")]), pd.Series(PA_([2.0, 1.0], "t CO2e/(t Steel)"))
+        )
+        self.assertEqual(aligned.pint.m.to_list(), [1e6, 2e6])
+        with self.assertRaises(DimensionalityError):
+            align_production_to_bm(pd.Series(PA_([1.0, 2.0], "t Steel")), ei_bm)
@@ -2,9 +2,9 @@ import datetime
 import json
 import os
 import unittest
-import warnings
 from typing import List
 
+import numpy as np
 import pandas as pd
 from utils import ITR_Encoder, assert_pint_series_equal
 
@@ -16,7 +16,7 @@ from ITR.data.base_providers import (
     EITargetProjector,
     EITrajectoryProjector,
 )
-from ITR.data.osc_units import PA_, Q_, asPintDataFrame
+from ITR.data.osc_units import PA_, Q_
 from ITR.interfaces import (
     EScope,
     ICompanyData,
@@ -251,26 +251,161 @@ class TestProjector(unittest.TestCase):
 
         ei_projector = EITrajectoryProjector(ProjectionControls(UPPER_PERCENTILE=0.9, LOWER_PERCENTILE=0.1))
         historic_df = ei_projector._extract_historic_df(fillna_data)
-        ei_projector._align_and_compute_missing_historic_ei(fillna_data, historic_df)
+        self.assertTrue((historic_df.dtypes == "float64").all())
+        historic_df = ei_projector._align_and_compute_missing_historic_ei(fillna_data, historic_df)
 
         historic_years = [column for column in historic_df.columns if isinstance(column, int)]
         projection_years = range(max(historic_years), ei_projector.projection_controls.TARGET_YEAR + 1)
-        with warnings.catch_warnings():
-            # Don't worry about warning that we are intentionally dropping units as we transpose
-            warnings.simplefilter("ignore")
-            historic_intensities_t = asPintDataFrame(
-                historic_df[historic_years].query(f"variable=='{VariablesConfig.EMISSIONS_INTENSITIES}'").T
-            ).pint.dequantify()
+        # Historic data is extracted already dequantified, with units in the last level of the index
+        historic_intensities_t = (
+            historic_df[historic_years].query(f"variable=='{VariablesConfig.EMISSIONS_INTENSITIES}'").T
+        )
         standardized_intensities_t = ei_projector._standardize(historic_intensities_t)
         intensity_trends_t = ei_projector._get_trends(standardized_intensities_t)
         extrapolated_t = ei_projector._extrapolate(intensity_trends_t, projection_years, historic_intensities_t)
-        # Restore row-wise shape of DataFrame
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            # pint units don't like being twisted from columns to rows, but it's ok
-            ei_projector._add_projections_to_companies(fillna_data, extrapolated_t.pint.quantify())
+        ei_projector._add_projections_to_companies(fillna_data, extrapolated_t)
         # Figure out what to test here--just making it through with funny company data is step 1!
 
+    def test_year_on_year_ratios(self):
+        intensities = pd.DataFrame(
+            {
+                "flat_zero": [0.0, 0.0, 0.0],
+                "to_negative": [2.0, 1.0, -0.1],
+                "halving": [4.0, 2.0, 1.0],
+                "gap": [1.0, float("nan"), 1.0],
+            },
+            index=[2019, 2020, 2021],
+        )
+        ratios = self.projector._year_on_year_ratios(intensities.to_numpy())
+        self.assertTrue(pd.isna(ratios[0]).all())
+        self.assertEqual(ratios[1:, 0].tolist(), [0.0, 0.0])
+        self.assertEqual(ratios[1:, 1].tolist(), [-0.5, -1.0])
+        self.assertEqual(ratios[1:, 2].tolist(), [-0.5, -0.5])
+        self.assertTrue(pd.isna(ratios[1:, 3]).all())
+        # A series with no valid ratios at all is treated as unchanged
+        trends = self.projector._get_trends(intensities)
+        self.assertEqual(trends["gap"], 0.0)
+        # Trends are clipped to the configured bounds
+        self.assertEqual(trends["halving"], self.projector.projection_controls.LOWER_DELTA)
+
+    def test_winsorize(self):
+        intensities = pd.DataFrame(
+            {
+                "gap": [1.0, float("nan"), float("nan"), 4.0, float("nan")],
+                "outlier": [1.0, 1.0, 1.0, 1.0, 100.0],
+                "empty": [float("nan")] * 5,
+            },
+            index=range(2016, 2021),
+        )
+        winsorized = self.projector._winsorize(intensities)
+        # Values are clipped to the 10th and 90th percentiles of their series, then inside gaps are interpolated
+        np.testing.assert_allclose(winsorized["gap"].to_numpy()[:4], [1.3, 2.1, 2.9, 3.7])
+        self.assertTrue(np.isnan(winsorized["gap"].iloc[-1]))
+        np.testing.assert_allclose(winsorized["outlier"].to_numpy(), [1.0, 1.0, 1.0, 1.0, 60.4])
+        self.assertTrue(winsorized["empty"].isna().all())
+
+    @unittest.skipUnless(ITR.HAS_UNCERTAINTIES, "requires uncertainties")
+    def test_winsorize_uncertainties(self):
+        intensities = pd.DataFrame(
+            {
+                "uncertain": ITR.uarray(np.array([1.0, np.nan, 3.0]), np.array([0.1, 0.0, 0.1])),
+                "certain": [1.0, 2.0, 3.0],
+            },
+            index=range(2019, 2022),
+        )
+        winsorized = self.projector._winsorize(intensities)
+        self.assertEqual(winsorized["certain"].dtype, np.float64)
+        np.testing.assert_allclose(ITR.nominal_values(winsorized["uncertain"].to_numpy()), [1.2, 2.0, 2.8])
+        # The interpolated value takes the spread of its neighbors as its error term
+        np.testing.assert_allclose(ITR.std_devs(winsorized["uncertain"].to_numpy()), [0.1, 1.6, 0.1])
+
+    def test_extrapolate_missing_years(self):
+        historic_ei_t = pd.DataFrame(
+            {"declining": [2.0, 1.0, float("nan"), float("nan")], "flat": [1.0, 1.0, 1.0, 1.0]},
+            index=pd.Index(range(2018, 2022), name="year"),
+        )
+        trends_t = pd.Series({"declining": -0.1, "flat": 0.0})
+        extrapolated_t = self.projector._extrapolate(trends_t, range(2021, 2024), historic_ei_t)
+        self.assertEqual(extrapolated_t.index.to_list(), list(range(2018, 2024)))
+        # The k-th missing historic value is the last valid value times (1+trend)**k, and so are projections
+        np.testing.assert_allclose(extrapolated_t["declining"].to_numpy(), [2.0, 1.0, 0.9, 0.81, 0.729, 0.6561])
+        np.testing.assert_allclose(extrapolated_t["flat"].to_numpy(), [1.0] * 6)
+
+    def test_backfill_to_base_year(self):
+        companies = [
+            ICompanyData(
+                company_name=f"Company {c}",
+                company_id=c,
+                region="Europe",
+                sector="Steel",
+                emissions_metric="t CO2",
+                production_metric="t Steel",
+                base_year_production="2.0 t Steel",
+                ghg_s1s2=ghg_s1s2,
+            )
+            for c, ghg_s1s2 in [("A", None), ("B", "5.0 t CO2")]
+        ]
+        nan = float("nan")
+        historic_ei_t = pd.DataFrame(
+            [[nan, nan, nan], [nan, nan, nan], [nan, 1.0, nan], [2.0, 0.5, nan], [1.5, 0.5, 4.0]],
+            index=pd.Index(range(2017, 2022), name="year"),
+            columns=pd.MultiIndex.from_tuples(
+                [
+                    ("A", VariablesConfig.EMISSIONS_INTENSITIES, EScope.S1S2, "t CO2/(t Steel)"),
+                    ("B", VariablesConfig.EMISSIONS_INTENSITIES, EScope.S1S2, "t CO2/(t Steel)"),
+                    ("B", VariablesConfig.EMISSIONS_INTENSITIES, EScope.S3, "t CO2/(t Steel)"),
+                ],
+                names=[ColumnsConfig.COMPANY_ID, ColumnsConfig.VARIABLE, ColumnsConfig.SCOPE, "unit"],
+            ),
+        )
+        backfilled_t = self.projector._backfill_to_base_year(companies, historic_ei_t)
+        # Nothing is backfilled before BASE_YEAR (2019)
+        for column, expected in [
+            (historic_ei_t.columns[0], [nan, nan, 2.0, 2.0, 1.5]),
+            (historic_ei_t.columns[1], [nan, nan, 1.0, 0.5, 0.5]),
+            (historic_ei_t.columns[2], [nan, nan, 4.0, 4.0, 4.0]),
+        ]:
+            np.testing.assert_allclose(backfilled_t[column].to_numpy(), expected)
+        # Missing base year emissions are computed from backfilled intensities and base year production
+        self.assertEqual(companies[0].ghg_s1s2, Q_(4.0, "t CO2"))
+        self.assertTrue(ITR.isna(companies[0].ghg_s3))
+        self.assertEqual(companies[1].ghg_s1s2, Q_(5.0, "t CO2"))
+        self.assertEqual(companies[1].ghg_s3, Q_(8.0, "t CO2"))
+
+    def test_chunked_trajectories(self):
+        projections = EITrajectoryProjector(ProjectionControls(PROJECTION_CHUNK_SIZE=4)).project_ei_trajectories(
+            self.companies
+        )
+        projections_dict = [projection.model_dump() for projection in projections]
+        test_successful = is_pint_dict_equal(projections_dict, self.reference_projections)
+        self.assertEqual(test_successful, True)
+
+    def test_trajectory_variants(self):
+        variants = [ProjectionControls(), ProjectionControls(LOWER_DELTA=-0.05, TREND_CALC_METHOD=pd.DataFrame.mean)]
+        original_projections = [company.projected_intensities for company in self.companies]
+        stacked = self.projector.project_ei_trajectory_variants(self.companies, variants)
+        scopes = EScope.get_scopes()
+        self.assertEqual(
+            stacked.to_numpy().reshape(len(variants), len(self.companies), len(scopes), -1).shape,
+            (2, len(self.companies), len(scopes), 2050 - 2019 + 1),
+        )
+        # The sweep leaves companies alone, and the first variant matches an ordinary projection
+        self.assertTrue(all(c.projected_intensities is orig for c, orig in zip(self.companies, original_projections)))
+        projections = self.projector.project_ei_trajectories(self.companies)
+        for company in projections[:5]:
+            for scope_name in scopes:
+                company_projection = company.projected_intensities[scope_name]
+                variant = stacked.loc[(0, company.company_id, EScope[scope_name])]
+                if company_projection is None:
+                    self.assertTrue(variant.isna().all(axis=None))
+                    continue
+                self.assertEqual(variant.index[0], str(company_projection.projections.dtype.units))
+                assert_pint_series_equal(
+                    self,
+                    pd.Series(PA_(variant.iloc[0].to_numpy(), variant.index[0]), index=variant.columns),
+                    company_projection.projections,
+                )
+
     # Need test data in order to test mean
     def test_median(self):
         projections = EITrajectoryProjector(
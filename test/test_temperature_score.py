@@ -1,12 +1,13 @@
 import os
 import unittest
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 from utils import assert_pint_series_equal
 
 import ITR  # noqa F401
-from ITR.configs import ColumnsConfig
+from ITR.configs import ColumnsConfig, TemperatureScoreConfig
 from ITR.data.osc_units import Q_, asPintDataFrame, requantify_df_from_columns, ureg
 from ITR.interfaces import EScope, ETimeFrames
 from ITR.portfolio_aggregation import PortfolioAggregationMethod
@@ -168,6 +169,39 @@ class TestTemperatureScore(unittest.TestCase):
             msg="The aggregated fallback temp score was incorrect",
         )
 
+    def test_temp_score_concurrent_controls(self) -> None:
+        """
+        Test that calculations with different controls can run concurrently without changing the global controls.
+
+        :return:
+        """
+        default_controls = TemperatureScoreConfig.CONTROLS_CONFIG
+        tcre_controls = default_controls.model_copy(update={"tcre": Q_(1.0, ureg.delta_degC)})
+
+        def company_t_score(controls):
+            scores, _ = ITR.utils.calculate(
+                self.data.copy(),
+                fallback_score=Q_(3.2, ureg.delta_degC),
+                aggregation_method=PortfolioAggregationMethod.WATS,
+                grouping=None,
+                time_frames=[ETimeFrames.LONG],
+                scopes=EScope.get_result_scopes(),
+                anonymize=False,
+                aggregate=False,
+                controls=controls,
+            )
+            return scores[(scores["company_name"] == "Company T") & (scores["scope"] == EScope.S1S2)][
+                "temperature_score"
+            ].iloc[0]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            scores = list(executor.map(company_t_score, [default_controls, tcre_controls] * 2))
+        self.assertIs(TemperatureScoreConfig.CONTROLS_CONFIG, default_controls)
+        self.assertEqual(scores[0], scores[2])
+        self.assertEqual(scores[1], scores[3])
+        self.assertAlmostEqual(scores[1], Q_(1.65, ureg.delta_degC), places=2)
+        self.assertEqual(scores[0], company_t_score(None))
+
     def test_portfolio_aggregations(self):
         scores = self.temperature_score.calculate(self.data)
         aggregations = self.temperature_score.aggregate_scores(scores)